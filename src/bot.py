@@ -4,13 +4,16 @@ Telegram LibGen Bot - Main bot file
 A Telegram bot that searches LibGen sites for books and returns download links.
 """
 
-import logging
 import re
 import os
+import html
 import asyncio
 import time
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Awaitable
 from io import BytesIO
+from functools import lru_cache
+from collections import defaultdict, deque
+from urllib.parse import quote, urlparse, unquote
 import aiohttp
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import (
@@ -19,15 +22,17 @@ from telegram.ext import (
     MessageHandler, 
     CallbackQueryHandler,
     ContextTypes,
+    AIORateLimiter,
     filters
 )
 from dotenv import load_dotenv
 from telegram.request import HTTPXRequest
 
-from .libgen_search import LibGenSearcher
+from .libgen_search import get_searcher, FILENAME_EXT_RE, FILENAME_RE, TRUTHY_VALUES
 from .utils.logger import setup_logger
 from .utils.http_client import get_http_client, close_http_client, record_request_performance
 from .utils.book_formatter import BookFormatter
+from .utils.event_loop import install_uvloop
 # Monitoring disabled by user request
 
 # Load environment variables
@@ -36,14 +41,149 @@ load_dotenv('/app/.env')
 # Setup logging
 logger = setup_logger(__name__)
 
+# Callback data of the result-page buttons: "page_<page>" or "links_<book index>"
+_CALLBACK_DATA_RE = re.compile(r'^(page|links)_(\d+)$')
+
+# Download link messages sent concurrently per chunk, kept under Telegram's burst limit
+_LINK_MESSAGES_PER_CHUNK = 3
+
+# BookFormatter is stateless, so one instance serves every bot
+_FORMATTER = BookFormatter()
+
+# Seconds a search or link lookup may take before its status placeholder is sent; faster (cached) answers skip it
+_STATUS_PLACEHOLDER_DELAY = 0.25
+
+# Seconds a chat's worker waits for more work before it is torn down
+_CHAT_WORKER_IDLE_TIMEOUT = 60
+
+# Shortest text message treated as a search query
+_MIN_QUERY_LENGTH = 3
+
+# Alternative search sites for books without an MD5.
+# Optimized for English Book Retrieval - Priority Order (September 2025); "{query}" is the search query.
+_ALTERNATIVE_SEARCH_TEMPLATES = (
+    # Rank #1: LibGen "Format 2" Mirrors (Top performing for English books)
+    "https://libgen.la/search.php?req={query}",
+    "https://libgen.li/search.php?req={query}",
+    "https://libgen.gl/search.php?req={query}",
+    "https://libgen.vg/search.php?req={query}",
+    "https://libgen.bz/search.php?req={query}",
+    # Rank #2: Anna's Archive (Meta-search aggregating LibGen, Sci-Hub, Z-Library)
+    "https://annas-archive.org/search?q={query}",
+    "https://annas-archive.li/search?q={query}",
+    "https://annas-archive.se/search?q={query}",
+    # Rank #3: Z-Library (Large database, good performance)
+    "https://z-library.sk/s/{query}",
+    # Rank #4: Ocean of PDF (Clean interface, quick downloads)
+    "https://oceanofpdf.com/?s={query}",
+    # Rank #5: Liber3 (Fast and typically ad-free)
+    "https://liber3.eth.limo/search?q={query}",
+    # Rank #6: Memory of the World (Solid fallback option)
+    "https://library.memoryoftheworld.org/search?q={query}",
+    # Additional sources
+    "http://library.lol/search/{query}",
+    "https://cyberleninka.ru/search?q={query}",
+)
+
+
+@lru_cache(maxsize=4096)
+def _render_book_line(index: int, title: str, author: str, extension: str, year: str, size: str) -> str:
+    """
+    Render one book entry of a results page from the raw book fields.
+    
+    Cached because pages are re-rendered on every flip; truncating and escaping
+    happen inside, so a cache hit skips them too. Every field is scraped text,
+    so all of them are escaped for the HTML message.
+    """
+    title = _FORMATTER.clean_text(title, BookFormatter.MAX_TITLE_LENGTH)
+    author = _FORMATTER.clean_text(author, BookFormatter.MAX_AUTHOR_LENGTH)
+    return (
+        f"📚 <b>{index}. {title}</b>\n"
+        f"👤 {author}  •  📄 {html.escape(extension.upper())}  •  📅 {html.escape(str(year))}  •  💾 {html.escape(str(size))}\n\n"
+    )
+
+
+@lru_cache(maxsize=256)
+def _results_page_keyboard(page: int, start_idx: int, end_idx: int, has_next: bool) -> InlineKeyboardMarkup:
+    """Build the buttons for one results page; markups are immutable, so cached ones are shared."""
+    buttons = []
+    
+    # Row 1: Get Download Links buttons for each book on this page, in rows of 2
+    link_buttons = [
+        InlineKeyboardButton(f"📥 {book_idx + 1} 📥", callback_data=f"links_{book_idx}")
+        for book_idx in range(start_idx, end_idx)
+    ]
+    for i in range(0, len(link_buttons), 2):
+        buttons.append(link_buttons[i:i+2])
+    
+    # Row 2: Navigation buttons
+    nav_buttons = []
+    if page > 0:
+        nav_buttons.append(InlineKeyboardButton("⬅️ Previous 5", callback_data=f"page_{page-1}"))
+    if has_next:
+        nav_buttons.append(InlineKeyboardButton("➡️ Next 5", callback_data=f"page_{page+1}"))
+    
+    if nav_buttons:
+        buttons.append(nav_buttons)
+    
+    return InlineKeyboardMarkup(buttons)
+
+
+class _DeferredStatusMessage:
+    """
+    Status reply whose placeholder is only sent if the work outlasts a short delay.
+    
+    send is the coroutine function that puts the first text on screen, e.g. a
+    message's reply_text or a callback query's edit_message_text. edit_text()
+    edits the placeholder once it is out; if the work finished first, the
+    placeholder is cancelled and the text is sent through send instead.
+    cancel() drops a placeholder that has not been sent yet.
+    """
+    
+    def __init__(self, send, placeholder_text: str, delay: float):
+        self._send = send
+        self._sent = None
+        self._sending = False
+        self._task = asyncio.create_task(self._send_placeholder(placeholder_text, delay))
+        
+    async def _send_placeholder(self, text: str, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._sending = True
+        try:
+            self._sent = await self._send(text)
+        except Exception as e:
+            logger.debug("Failed to send status placeholder: %s", e)
+            
+    async def edit_text(self, text: str, **kwargs):
+        if not self._task.done():
+            if self._sending:
+                # The placeholder is already on its way; edit it rather than racing it
+                await self._task
+            else:
+                self._task.cancel()
+        
+        if self._sent is None:
+            self._sent = await self._send(text, **kwargs)
+            return self._sent
+        return await self._sent.edit_text(text, **kwargs)
+        
+    async def cancel(self) -> None:
+        if not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
 class TelegramLibGenBot:
     """Main bot class for LibGen search functionality."""
     
     def __init__(self, token: str):
         """Initialize the bot with Telegram token."""
         self.token = token
-        self.searcher = LibGenSearcher()
-        self.formatter = BookFormatter()
+        self.searcher = get_searcher()
+        self.formatter = _FORMATTER
         
         # Load configuration from environment variables
         self._load_config()
@@ -51,6 +191,14 @@ class TelegramLibGenBot:
         # Initialize optimized HTTP client
         self.http_client = get_http_client()
         
+        # Per-chat work queues: slow jobs run in order within a chat without holding up other chats
+        self.chat_queues: Dict[int, asyncio.Queue] = {}
+        self.chat_workers: Dict[int, asyncio.Task] = {}
+        
+        # Timestamps of each user's latest searches, for rate limiting
+        self.recent_searches = defaultdict(lambda: deque(maxlen=self.rate_limit_searches))
+        self.recent_searches_pruned_at = time.monotonic()
+        
         # Initialize file handlers if file sending is enabled
         # File handling disabled - only download links
         self.file_handler = None
@@ -80,11 +228,12 @@ class TelegramLibGenBot:
         """Load all configuration from environment variables."""
         # Telegram settings
         send_doc_env = os.getenv('TELEGRAM_SEND_DOCUMENT', 'false').strip().lower()
-        self.send_document_enabled = send_doc_env in ['1', 'true', 'yes', 'on']
+        self.send_document_enabled = send_doc_env in TRUTHY_VALUES
         try:
             self.max_download_mb = float(os.getenv('TELEGRAM_MAX_DOWNLOAD_MB', '50'))
         except ValueError:
             self.max_download_mb = 50.0
+        self.max_messages_per_second = float(os.getenv('TELEGRAM_MAX_MESSAGES_PER_SECOND', '28'))
         
         # Bot behavior settings
         self.books_per_page = int(os.getenv('BOT_BOOKS_PER_PAGE', '5'))
@@ -97,16 +246,36 @@ class TelegramLibGenBot:
         self.cancellation_check_interval = float(os.getenv('BOT_CANCELLATION_CHECK_INTERVAL', '0.25'))
         self.cancellation_checks_count = int(os.getenv('BOT_CANCELLATION_CHECKS_COUNT', '20'))
         
+        # Rate limiting: at most this many searches per user within the window (seconds)
+        self.rate_limit_searches = max(1, int(os.getenv('BOT_RATE_LIMIT_SEARCHES', '3')))
+        self.rate_limit_window = float(os.getenv('BOT_RATE_LIMIT_WINDOW', '10'))
+        
         # Message customization
         self.bot_name = os.getenv('BOT_NAME', 'LibGen Search Bot')
         self.bot_description = os.getenv('BOT_DESCRIPTION', 'Search for books by sending me a book title, author name, or ISBN.')
         
+        # /start and /help replies only depend on the bot name, so build them once
+        self.welcome_message = f"🤖 **{self.bot_name}**\n\nType your search query to start!"
+        self.help_message = (
+            f"📖 **{self.bot_name} Help**\n\n"
+            "**Commands:**\n"
+            "• `/start` - Start the bot\n"
+            "• `/help` - Show this help\n"
+            "• `/search <query>` - Search for books\n"
+            "• `/stats` - Show bot stats\n"
+            "• `/stop` - Stop current search\n\n"
+            "**How to search:**\n"
+            "• Book title: *'The Great Gatsby'*\n"
+            "• Author name: *'F. Scott Fitzgerald'*\n"
+            "• ISBN: *'978-0-7432-7356-5'*"
+        )
+        
         # Feature flags
-        self.feature_download_links = os.getenv('FEATURE_DOWNLOAD_LINKS', 'true').lower() in ['true', '1', 'yes', 'on']
-        self.feature_alternative_search = os.getenv('FEATURE_ALTERNATIVE_SEARCH', 'true').lower() in ['true', '1', 'yes', 'on']
-        self.feature_pagination = os.getenv('FEATURE_PAGINATION', 'true').lower() in ['true', '1', 'yes', 'on']
-        self.feature_stop_command = os.getenv('FEATURE_STOP_COMMAND', 'true').lower() in ['true', '1', 'yes', 'on']
-        self.feature_send_files = os.getenv('FEATURE_SEND_FILES', 'false').lower() in ['true', '1', 'yes', 'on']
+        self.feature_download_links = os.getenv('FEATURE_DOWNLOAD_LINKS', 'true').lower() in TRUTHY_VALUES
+        self.feature_alternative_search = os.getenv('FEATURE_ALTERNATIVE_SEARCH', 'true').lower() in TRUTHY_VALUES
+        self.feature_pagination = os.getenv('FEATURE_PAGINATION', 'true').lower() in TRUTHY_VALUES
+        self.feature_stop_command = os.getenv('FEATURE_STOP_COMMAND', 'true').lower() in TRUTHY_VALUES
+        self.feature_send_files = os.getenv('FEATURE_SEND_FILES', 'false').lower() in TRUTHY_VALUES
         
         # HTTP settings
         self.http_user_agent = os.getenv('HTTP_USER_AGENT', 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0 Safari/537.36')
@@ -117,28 +286,14 @@ class TelegramLibGenBot:
         if not update.message:
             return
             
-        welcome_message = f"🤖 **{self.bot_name}**\n\nType your search query to start!"
-        await update.message.reply_text(welcome_message)
+        await update.message.reply_text(self.welcome_message)
         
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /help command."""
         if not update.message:
             return
             
-        help_message = (
-            f"📖 **{self.bot_name} Help**\n\n"
-            "**Commands:**\n"
-            "• `/start` - Start the bot\n"
-            "• `/help` - Show this help\n"
-            "• `/search <query>` - Search for books\n"
-            "• `/stats` - Show bot stats\n"
-            "• `/stop` - Stop current search\n\n"
-            "**How to search:**\n"
-            "• Book title: *'The Great Gatsby'*\n"
-            "• Author name: *'F. Scott Fitzgerald'*\n"
-            "• ISBN: *'978-0-7432-7356-5'*"
-        )
-        await update.message.reply_text(help_message)
+        await update.message.reply_text(self.help_message)
         
     async def stats_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /stats command to show bot performance statistics."""
@@ -148,15 +303,17 @@ class TelegramLibGenBot:
         stats = self.search_stats
         success_rate = (stats['successful_searches'] / stats['total_searches'] * 100) if stats['total_searches'] > 0 else 0
         
-        # Get mirror status
+        # Get mirror and cache status
         mirror_status = self.searcher._get_mirror_status()
+        cache_status = self.searcher._get_cache_status()
         
         stats_message = (
             f"📊 **{self.bot_name} Stats**\n\n"
             f"**Search:** {stats['total_searches']} total, {success_rate:.1f}% success\n"
             f"**Response Time:** {stats['average_response_time']:.2f}s avg\n"
             f"**Downloads:** {stats['total_downloads']} files\n"
-            f"**Uploads:** {stats['total_uploads']} files\n\n"
+            f"**Uploads:** {stats['total_uploads']} files\n"
+            f"**Cache:** {cache_status['hit_rate']:.1f}% hit rate ({cache_status['entries']} cached queries)\n\n"
             f"**Mirrors:** {mirror_status['available_mirrors']}/{mirror_status['total_mirrors']} available\n"
             f"**Failed:** {mirror_status['failed_mirrors']} mirrors"
         )
@@ -186,8 +343,12 @@ class TelegramLibGenBot:
             return
             
         query = ' '.join(context.args)
-        # Create task and don't await - let search run in background for true concurrency
-        asyncio.create_task(self._handle_search_non_blocking(update, context, query))
+        if self._is_rate_limited(update):
+            await update.message.reply_text("⏳ Too many searches. Please wait a few seconds.")
+            return
+            
+        # Queue on the chat's worker and return, so the update dispatcher stays free
+        self._enqueue_for_chat(update.effective_chat.id, self._handle_search_non_blocking(update, context, query))
         
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle text messages as search queries."""
@@ -195,32 +356,106 @@ class TelegramLibGenBot:
             return
             
         query = update.message.text.strip()
-        if query:
-            # Create a completely non-blocking task
-            asyncio.create_task(self._handle_search_non_blocking(update, context, query))
-        else:
+        if not query:
             # Send immediate response for empty messages
             await update.message.reply_text("Send a book title, author, or ISBN to search.")
+            return
+            
+        # Don't spend a mirror round-trip on input that can't match a book
+        if len(query) < _MIN_QUERY_LENGTH or not any(c.isalnum() for c in query):
+            await update.message.reply_text("❌ Please send a longer query (a title, author, or ISBN).")
+            return
+            
+        if self._is_rate_limited(update):
+            await update.message.reply_text("⏳ Too many searches. Please wait a few seconds.")
+            return
+            
+        # Queue on the chat's worker and return, so the update dispatcher stays free
+        self._enqueue_for_chat(update.effective_chat.id, self._handle_search_non_blocking(update, context, query))
+    
+    def _enqueue_for_chat(self, chat_id: int, job: Awaitable[None]) -> None:
+        """Run a job on the chat's worker, after any jobs already queued for that chat."""
+        queue = self.chat_queues.get(chat_id)
+        if queue is None:
+            queue = self.chat_queues[chat_id] = asyncio.Queue()
+            self.chat_workers[chat_id] = asyncio.create_task(self._drain_chat_queue(chat_id, queue))
+        queue.put_nowait(job)
+    
+    async def _drain_chat_queue(self, chat_id: int, queue: asyncio.Queue) -> None:
+        """Run a chat's queued jobs one at a time; exit once the chat has been idle for a while."""
+        while True:
+            try:
+                job = await asyncio.wait_for(queue.get(), timeout=_CHAT_WORKER_IDLE_TIMEOUT)
+            except asyncio.TimeoutError:
+                # A job may have been queued after the timeout fired; keep draining until it runs
+                if not queue.empty():
+                    continue
+                del self.chat_queues[chat_id]
+                del self.chat_workers[chat_id]
+                return
+            
+            try:
+                await job
+            except Exception:
+                logger.exception(f"Chat {chat_id} job failed")
+    
+    async def _stop_chat_workers(self) -> None:
+        """Cancel every chat worker and discard the jobs still waiting in their queues."""
+        workers = list(self.chat_workers.values())
+        # A running job is cancelled with its worker, so its own cleanup (like dropping a pending placeholder) runs here
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        
+        # Close queued coroutines so they aren't reported as never awaited
+        for queue in self.chat_queues.values():
+            while not queue.empty():
+                queue.get_nowait().close()
+        
+        self.chat_queues.clear()
+        self.chat_workers.clear()
+    
+    def _is_rate_limited(self, update: Update) -> bool:
+        """Record a search attempt and return True if the user is over the rate limit."""
+        user = update.effective_user
+        key = user.id if user else update.effective_chat.id
+        now = time.monotonic()
+        
+        # At most once per window, forget users whose newest search is already outside it
+        if now - self.recent_searches_pruned_at >= self.rate_limit_window:
+            stale_keys = [
+                stale_key for stale_key, stale_timestamps in self.recent_searches.items()
+                if now - stale_timestamps[-1] >= self.rate_limit_window
+            ]
+            for stale_key in stale_keys:
+                del self.recent_searches[stale_key]
+            self.recent_searches_pruned_at = now
+        
+        timestamps = self.recent_searches[key]
+        if len(timestamps) == self.rate_limit_searches and now - timestamps[0] < self.rate_limit_window:
+            return True
+        timestamps.append(now)
+        return False
     
     async def _handle_search_non_blocking(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: str) -> None:
         """Completely non-blocking search handler."""
+        # Only show "Searching..." if the search is not answered straight from the cache
+        searching_msg = _DeferredStatusMessage(update.message.reply_text, "🔍 Searching... Please wait!", _STATUS_PLACEHOLDER_DELAY)
         try:
-            # Send instant response first
-            searching_msg = await update.message.reply_text("🔍 Searching... Please wait!")
-            
             # Now call the search handler with the message
             await self.handle_search_with_message(update, context, query, searching_msg)
         except Exception as e:
             logger.error(f"Error in non-blocking search: {e}")
             try:
-                await update.message.reply_text("❌ An error occurred during search. Please try again.")
+                await searching_msg.edit_text("❌ An error occurred during search. Please try again.")
             except:
                 pass
+        finally:
+            # Also runs when _stop_chat_workers cancels the search, so no placeholder is left pending
+            await searching_msg.cancel()
             
     async def handle_search(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: str) -> None:
         """Process search query and return results immediately."""
-        import time
-        
         # Get user information for logging
         user_id = update.effective_user.id if update.effective_user else "Unknown"
         username = update.effective_user.username if update.effective_user and update.effective_user.username else "NoUsername"
@@ -234,7 +469,7 @@ class TelegramLibGenBot:
         context.user_data.pop('stop_search', None)
         
         # Track search performance
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.search_stats['total_searches'] += 1
         
         # Send immediate response message
@@ -256,7 +491,7 @@ class TelegramLibGenBot:
             results = await self.searcher.search(query)
             
             # Calculate response time
-            response_time = time.time() - start_time
+            response_time = time.perf_counter() - start_time
             self.search_stats['successful_searches'] += 1
             
             # Log completion
@@ -278,14 +513,12 @@ class TelegramLibGenBot:
                 
         except Exception as e:
             self.search_stats['failed_searches'] += 1
-            response_time = time.time() - start_time
+            response_time = time.perf_counter() - start_time
             logger.error(f"❌ SEARCH ERROR - User: {user_id} | Query: '{query}' | Time: {response_time:.2f}s | Error: {str(e)}")
             await searching_msg.edit_text(f"❌ Search failed for: '{query}'")
 
     async def handle_search_with_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query: str, searching_msg) -> None:
         """Process search query with pre-sent message for instant response."""
-        import time
-        
         # Get user information for logging
         user_id = update.effective_user.id if update.effective_user else "Unknown"
         username = update.effective_user.username if update.effective_user and update.effective_user.username else "NoUsername"
@@ -299,7 +532,7 @@ class TelegramLibGenBot:
         context.user_data.pop('stop_search', None)
         
         # Track search performance
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.search_stats['total_searches'] += 1
         
         # Log that we're starting the search task
@@ -335,7 +568,7 @@ class TelegramLibGenBot:
                 return
             
             # Calculate response time
-            response_time = time.time() - start_time
+            response_time = time.perf_counter() - start_time
             self.search_stats['successful_searches'] += 1
             
             # Update average response time
@@ -347,7 +580,7 @@ class TelegramLibGenBot:
             
             # Log performance with concurrency info
             logger.info(f"✅ TRUE CONCURRENT SEARCH COMPLETED - {response_time:.2f}s | User: {user_id} | Query: '{query}' | Results: {len(results) if results else 0}")
-            record_request_performance(f"true_concurrent_search:{query}", response_time)
+            record_request_performance("bot://bot_search", response_time)
             
             # Record metrics
             # Metrics disabled by user request
@@ -372,9 +605,9 @@ class TelegramLibGenBot:
                 
         except Exception as e:
             self.search_stats['failed_searches'] += 1
-            response_time = time.time() - start_time
+            response_time = time.perf_counter() - start_time
             logger.error(f"❌ TRUE CONCURRENT SEARCH ERROR - User: {user_id} | Query: '{query}' | Time: {response_time:.2f}s | Error: {str(e)}")
-            record_request_performance(f"true_concurrent_search_error:{query}", response_time)
+            record_request_performance("bot://bot_search_error", response_time)
             
             # Record error metrics
             # Metrics disabled by user request
@@ -397,20 +630,18 @@ class TelegramLibGenBot:
         message_parts = []
         for i, book in enumerate(page_results, start_idx + 1):
             try:
-                title = book.get('title', 'Unknown Title')
-                author = book.get('author', 'Unknown Author')
-                year = book.get('year', 'Unknown')
-                format_ext = book.get('extension', 'Unknown').upper()
-                size = book.get('size', 'Unknown')
-                
-                book_info = f"📚 <b>{i}. {title}</b>\n"
-                book_info += f"👤 {author}  •  📄 {format_ext}  •  📅 {year}  •  💾 {size}\n\n"
-                
-                message_parts.append(book_info)
+                message_parts.append(_render_book_line(
+                    i,
+                    book.get('title', 'Unknown Title'),
+                    book.get('author', 'Unknown Author'),
+                    book.get('extension', 'Unknown'),
+                    book.get('year', 'Unknown'),
+                    book.get('size', 'Unknown'),
+                ))
                 
             except Exception as e:
-                logger.debug(f"Error processing book {i}: {str(e)}")
-                simple_info = f"📚 <b>{i}. {book.get('title', 'Unknown')}</b>\n"
+                logger.debug("Error processing book %s: %s", i, e)
+                simple_info = f"📚 <b>{i}. {self.formatter.clean_text(book.get('title', 'Unknown'), BookFormatter.MAX_TITLE_LENGTH)}</b>\n"
                 simple_info += f"⚠️ Error loading details\n\n"
                 message_parts.append(simple_info)
         
@@ -421,31 +652,10 @@ class TelegramLibGenBot:
         total_pages = (len(results) + books_per_page - 1) // books_per_page
         message += f"📄 Page {page + 1}/{total_pages}  •  📊 {len(results)} results"
         
-        # Create pagination buttons
-        buttons = []
-        
-        # Row 1: Get Download Links buttons for each book on this page
-        link_buttons = []
-        for i, _ in enumerate(page_results):
-            book_idx = start_idx + i
-            link_buttons.append(InlineKeyboardButton(f"📥 {book_idx + 1} 📥", callback_data=f"links_{book_idx}"))
-        
-        # Split link buttons into rows of 2
-        for i in range(0, len(link_buttons), 2):
-            buttons.append(link_buttons[i:i+2])
-        
-        # Row 2: Navigation buttons
-        nav_buttons = []
-        if page > 0:
-            nav_buttons.append(InlineKeyboardButton("⬅️ Previous 5", callback_data=f"page_{page-1}"))
-        if end_idx < len(results):
-            nav_buttons.append(InlineKeyboardButton("➡️ Next 5", callback_data=f"page_{page+1}"))
-        
-        if nav_buttons:
-            buttons.append(nav_buttons)
+        # Pagination buttons only depend on the page layout, so the markup is shared
+        keyboard = _results_page_keyboard(page, start_idx, end_idx, end_idx < len(results))
         
         # Send message with buttons
-        keyboard = InlineKeyboardMarkup(buttons)
         await update.message.reply_text(
             message,
             parse_mode='HTML',
@@ -453,123 +663,8 @@ class TelegramLibGenBot:
             reply_markup=keyboard
         )
 
-    async def send_batched_results_with_links(self, update: Update, context: ContextTypes.DEFAULT_TYPE, results: List[Dict[str, Any]]) -> None:
-        """Send search results in batches of 5 books with download links."""
-        batch_size = 5
-        
-        for batch_start in range(0, len(results), batch_size):
-            # Check if user requested to stop
-            if context.user_data.get('stop_search'):
-                await update.message.reply_text("🛑 Search stopped")
-                return
-            
-            batch_end = min(batch_start + batch_size, len(results))
-            batch_results = results[batch_start:batch_end]
-            
-            message_parts = []
-            
-            for i, book in enumerate(batch_results, batch_start + 1):
-                # Check for stop request during processing
-                if context.user_data.get('stop_search'):
-                    await update.message.reply_text("🛑 Search stopped")
-                    return
-                    
-                try:
-                    # Format book details
-                    title = book.get('title', 'Unknown Title')
-                    author = book.get('author', 'Unknown Author')
-                    year = book.get('year', 'Unknown')
-                    format_ext = book.get('extension', 'Unknown').upper()
-                    size = book.get('size', 'Unknown')
-                    md5_hash = book.get('md5', '')
-                    
-                    book_info = f"<b>{i}. {title}</b>\n"
-                    book_info += f"<b>Author:</b> {author}\n"
-                    book_info += f"<b>Format:</b> {format_ext} | <b>Year:</b> {year} | <b>Size:</b> {size}\n"
-                    
-                    # Check for stop request before fetching links
-                    if context.user_data.get('stop_search'):
-                        await update.message.reply_text("🛑 Search stopped")
-                        return
-                    
-                    # Get download links for this book
-                    if md5_hash:
-                        try:
-                            # Use a cancellation-aware wrapper for download link fetching
-                            download_links = await self._fetch_links_with_cancellation(
-                                md5_hash, context, update
-                            )
-                            
-                            # If None returned, it means operation was cancelled
-                            if download_links is None:
-                                return
-                            
-                            # Final check for stop request after fetching links
-                            if context.user_data.get('stop_search'):
-                                await update.message.reply_text("🛑 Search stopped")
-                                return
-                            
-                            if download_links:
-                                book_info += "🔗 **Links:**\n"
-                                for link in download_links[:8]:  # Show up to 8 links per book
-                                    url = link.get('url', '')
-                                    if url:
-                                        book_info += f"• {url}\n"
-                            else:
-                                book_info += "❌ No links available\n"
-                        except asyncio.TimeoutError:
-                            logger.debug(f"Timeout fetching links for {title}")
-                            book_info += "⏰ Timeout - try manual search\n"
-                        except Exception as e:
-                            logger.debug(f"Failed to get links for {title}: {str(e)}")
-                            book_info += "❌ Could not fetch links\n"
-                    else:
-                        # Try alternative search methods for books without MD5
-                        alternative_links = await self.get_alternative_search_links(title, author, format_ext)
-                        if alternative_links:
-                            book_info += "🔍 **Search Links:**\n"
-                            for link in alternative_links[:3]:  # Limit alternative links
-                                book_info += f"• {link}\n"
-                        else:
-                            book_info += "❌ No MD5 hash - try manual search\n"
-                    
-                    book_info += "\n"
-                    message_parts.append(book_info)
-                    
-                    # Configurable delay between books to allow stop command processing
-                    await asyncio.sleep(self.book_processing_delay)
-                    
-                except Exception as e:
-                    logger.debug(f"Error processing book {i}: {str(e)}")
-                    simple_info = f"📚 <b>{i}. {book.get('title', 'Unknown')}</b>\n\n"
-                    simple_info += f"⚠️ <i>Error loading book details</i>\n\n"
-                    simple_info += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-                    message_parts.append(simple_info)
-            
-            # Send the batch message
-            batch_message = "".join(message_parts)
-            if batch_message:
-                try:
-                    await update.message.reply_text(
-                        batch_message,
-                        parse_mode='HTML',
-                        disable_web_page_preview=True
-                    )
-                    
-                    # Check for stop request after sending each batch
-                    if context.user_data.get('stop_search'):
-                        await update.message.reply_text("🛑 Search stopped")
-                        return
-                        
-                except Exception as e:
-                    logger.debug(f"Error sending batch message: {str(e)}")
-                    # Fallback to plain text
-                    await update.message.reply_text(f"❌ Error formatting books {batch_start + 1}-{batch_end}")
-
     async def get_alternative_search_links(self, title: str, author: str, format_ext: str) -> List[str]:
         """Generate alternative search links for books without MD5 hashes."""
-        from urllib.parse import quote
-        
         alternative_links = []
         
         # Create search terms
@@ -584,30 +679,9 @@ class TelegramLibGenBot:
         search_query = '+'.join(search_terms[:3])  # Limit to avoid too long URLs
         
         if search_query:
-            # Optimized for English Book Retrieval - Priority Order (September 2025)
-            alternative_links.extend([
-                # Rank #1: LibGen "Format 2" Mirrors (Top performing for English books)
-                f"https://libgen.la/search.php?req={search_query}",
-                f"https://libgen.li/search.php?req={search_query}",
-                f"https://libgen.gl/search.php?req={search_query}",
-                f"https://libgen.vg/search.php?req={search_query}",
-                f"https://libgen.bz/search.php?req={search_query}",
-                # Rank #2: Anna's Archive (Meta-search aggregating LibGen, Sci-Hub, Z-Library)
-                f"https://annas-archive.org/search?q={search_query}",
-                f"https://annas-archive.li/search?q={search_query}",
-                f"https://annas-archive.se/search?q={search_query}",
-                # Rank #3: Z-Library (Large database, good performance)
-                f"https://z-library.sk/s/{search_query}",
-                # Rank #4: Ocean of PDF (Clean interface, quick downloads)
-                f"https://oceanofpdf.com/?s={search_query}",
-                # Rank #5: Liber3 (Fast and typically ad-free)
-                f"https://liber3.eth.limo/search?q={search_query}",
-                # Rank #6: Memory of the World (Solid fallback option)
-                f"https://library.memoryoftheworld.org/search?q={search_query}",
-                # Additional sources
-                f"http://library.lol/search/{search_query}",
-                f"https://cyberleninka.ru/search?q={search_query}",
-            ])
+            alternative_links.extend(
+                template.format(query=search_query) for template in _ALTERNATIVE_SEARCH_TEMPLATES
+            )
         
         return alternative_links
 
@@ -616,15 +690,13 @@ class TelegramLibGenBot:
         query = update.callback_query
         await query.answer()
         
-        if not query.data:
-            return
-        
-        data = query.data
+        # The handler's pattern already matched and captured the callback data
+        action, index = context.match.groups()
         
         try:
-            if data.startswith('page_'):
+            if action == 'page':
                 # Handle pagination
-                page = int(data.split('_')[1])
+                page = int(index)
                 results = context.user_data.get('last_search_results', [])
                 
                 if not results:
@@ -634,9 +706,9 @@ class TelegramLibGenBot:
                 # Update the message with new page
                 await self.send_paginated_results_edit(query, context, results, page)
                 
-            elif data.startswith('links_'):
+            elif action == 'links':
                 # Handle download links request
-                book_idx = int(data.split('_')[1])
+                book_idx = int(index)
                 results = context.user_data.get('last_search_results', [])
                 
                 if not results or book_idx >= len(results):
@@ -644,10 +716,11 @@ class TelegramLibGenBot:
                     return
                 
                 book = results[book_idx]
-                await self.show_download_links(query, context, book, book_idx)
+                # Link lookups can take seconds; run them on the chat's worker
+                self._enqueue_for_chat(update.effective_chat.id, self.show_download_links(query, context, book, book_idx))
                 
         except Exception as e:
-            logger.debug(f"Callback query error: {str(e)}")
+            logger.debug("Callback query error: %s", e)
             await query.edit_message_text("❌ Error processing request. Try again.")
 
     async def send_paginated_results_edit(self, query, context: ContextTypes.DEFAULT_TYPE, results: List[Dict[str, Any]], page: int) -> None:
@@ -666,20 +739,18 @@ class TelegramLibGenBot:
         message_parts = []
         for i, book in enumerate(page_results, start_idx + 1):
             try:
-                title = book.get('title', 'Unknown Title')
-                author = book.get('author', 'Unknown Author')
-                year = book.get('year', 'Unknown')
-                format_ext = book.get('extension', 'Unknown').upper()
-                size = book.get('size', 'Unknown')
-                
-                book_info = f"📚 <b>{i}. {title}</b>\n"
-                book_info += f"👤 {author}  •  📄 {format_ext}  •  📅 {year}  •  💾 {size}\n\n"
-                
-                message_parts.append(book_info)
+                message_parts.append(_render_book_line(
+                    i,
+                    book.get('title', 'Unknown Title'),
+                    book.get('author', 'Unknown Author'),
+                    book.get('extension', 'Unknown'),
+                    book.get('year', 'Unknown'),
+                    book.get('size', 'Unknown'),
+                ))
                 
             except Exception as e:
-                logger.debug(f"Error processing book {i}: {str(e)}")
-                simple_info = f"📚 <b>{i}. {book.get('title', 'Unknown')}</b>\n"
+                logger.debug("Error processing book %s: %s", i, e)
+                simple_info = f"📚 <b>{i}. {self.formatter.clean_text(book.get('title', 'Unknown'), BookFormatter.MAX_TITLE_LENGTH)}</b>\n"
                 simple_info += f"⚠️ Error loading details\n\n"
                 message_parts.append(simple_info)
         
@@ -690,31 +761,10 @@ class TelegramLibGenBot:
         total_pages = (len(results) + books_per_page - 1) // books_per_page
         message += f"📄 Page {page + 1}/{total_pages}  •  📊 {len(results)} results"
         
-        # Create pagination buttons
-        buttons = []
-        
-        # Row 1: Get Download Links buttons for each book on this page
-        link_buttons = []
-        for i, _ in enumerate(page_results):
-            book_idx = start_idx + i
-            link_buttons.append(InlineKeyboardButton(f"📥 {book_idx + 1} 📥", callback_data=f"links_{book_idx}"))
-        
-        # Split link buttons into rows of 2
-        for i in range(0, len(link_buttons), 2):
-            buttons.append(link_buttons[i:i+2])
-        
-        # Row 2: Navigation buttons
-        nav_buttons = []
-        if page > 0:
-            nav_buttons.append(InlineKeyboardButton("⬅️ Previous 5", callback_data=f"page_{page-1}"))
-        if end_idx < len(results):
-            nav_buttons.append(InlineKeyboardButton("➡️ Next 5", callback_data=f"page_{page+1}"))
-        
-        if nav_buttons:
-            buttons.append(nav_buttons)
+        # Pagination buttons only depend on the page layout, so the markup is shared
+        keyboard = _results_page_keyboard(page, start_idx, end_idx, end_idx < len(results))
         
         # Edit message with new content
-        keyboard = InlineKeyboardMarkup(buttons)
         await query.edit_message_text(
             message,
             parse_mode='HTML',
@@ -777,9 +827,8 @@ class TelegramLibGenBot:
         logger.info(f"🔗 DOWNLOAD LINKS - User ID: {user_id} | Username: @{username} | Book: '{title}' | Size: {book_size} | Reason: File too large or send disabled")
         print(f"🔗 {title} / {user_name} / @{username}")
         
-        # Show getting links message
-        await query.edit_message_text(f"🔗 Getting links for *{title}*...")
-        print(f"📤 Getting links... / {user_name} / @{username}")
+        # Only show "Getting links..." if the links are not answered straight from the cache
+        links_msg = _DeferredStatusMessage(query.edit_message_text, f"🔗 Getting links for *{title}*...", _STATUS_PLACEHOLDER_DELAY)
         
         try:
             # Get download links with configurable timeout
@@ -790,7 +839,7 @@ class TelegramLibGenBot:
             )
             
             if not download_links:
-                await query.edit_message_text(
+                await links_msg.edit_text(
                     f"❌ No download links found for *{title}*\n\n"
                     f"🔍 Try manual search with MD5: `{md5_hash}`",
                     parse_mode='Markdown'
@@ -803,22 +852,21 @@ class TelegramLibGenBot:
             book_info += f"🔗 **Download Links ({len(download_links)} available):**\n"
             book_info += f"🔍 **MD5:** `{md5_hash}`"
             
-            await query.edit_message_text(
+            await links_msg.edit_text(
                 book_info,
                 parse_mode='Markdown',
                 disable_web_page_preview=True
             )
             
-            # Send each download link as a separate message
+            # Build one message per download link
+            link_messages = []
             for i, link in enumerate(download_links[:self.max_links_per_book], 1):
                 url = link.get('url', '')
-                link_type = link.get('type', 'direct_download')
                 link_name = link.get('name', 'Download')
                 
                 if url:
                     # Extract domain from URL for display
                     try:
-                        from urllib.parse import urlparse
                         domain = urlparse(url).netloc
                         if domain:
                             source_info = f" ({domain})"
@@ -827,18 +875,31 @@ class TelegramLibGenBot:
                     except:
                         source_info = ""
                     
-                    # Send individual link message
-                    link_message = f"📥 **{i}.** {link_name}{source_info}\n\n{url}"
-                    
-                    await context.bot.send_message(
-                        chat_id=query.message.chat_id,
-                        text=link_message,
-                        parse_mode='Markdown',
-                        disable_web_page_preview=True
-                    )
-                    
-                    # Small delay between messages to avoid rate limiting
-                    await asyncio.sleep(0.5)
+                    link_messages.append(f"📥 **{i}.** {link_name}{source_info}\n\n{url}")
+            
+            # Send the link messages a few at a time; each chunk shares one round-trip of latency
+            chat_id = query.message.chat_id
+            for chunk_start in range(0, len(link_messages), _LINK_MESSAGES_PER_CHUNK):
+                if chunk_start:
+                    # Pause between chunks to stay under Telegram's per-chat rate limit
+                    await asyncio.sleep(1.0)
+                
+                chunk = link_messages[chunk_start:chunk_start + _LINK_MESSAGES_PER_CHUNK]
+                send_results = await asyncio.gather(
+                    *(
+                        context.bot.send_message(
+                            chat_id=chat_id,
+                            text=link_message,
+                            parse_mode='Markdown',
+                            disable_web_page_preview=True
+                        )
+                        for link_message in chunk
+                    ),
+                    return_exceptions=True
+                )
+                for send_result in send_results:
+                    if isinstance(send_result, Exception):
+                        logger.warning("Failed to send download link message: %s", send_result)
             
             # Log successful completion of download links display
             logger.info(f"✅ LINKS DISPLAYED - User ID: {user_id} | Username: @{username} | Book: '{title}' | Links Count: {len(download_links[:self.max_links_per_book])} | Size: {book_size}")
@@ -846,89 +907,20 @@ class TelegramLibGenBot:
             print(f"📤 Sent {len(download_links)} download links / {user_name} / @{username}")
             
         except asyncio.TimeoutError:
-            await query.edit_message_text(
+            await links_msg.edit_text(
                 f"⏰ Timeout getting links for *{title}*\n\n"
                 f"🔍 Try manual search with MD5: `{md5_hash}`",
                 parse_mode='Markdown'
             )
         except Exception as e:
-            logger.debug(f"Error getting download links: {str(e)}")
-            await query.edit_message_text(
+            logger.debug("Error getting download links: %s", e)
+            await links_msg.edit_text(
                 f"❌ Error getting links for *{title}*\n\n"
                 "Try again later."
             )
-
-    async def _fetch_links_with_cancellation(self, md5_hash: str, context: ContextTypes.DEFAULT_TYPE, update: Update) -> Optional[List[Dict[str, Any]]]:
-        """Fetch download links with frequent cancellation checks."""
-        async def check_cancellation():
-            """Periodically check for stop requests."""
-            for _ in range(self.cancellation_checks_count):  # Configurable cancellation checks
-                if context.user_data.get('stop_search'):
-                    return True
-                await asyncio.sleep(self.cancellation_check_interval)
-            return False
-        
-        # Run the download link fetching and cancellation check concurrently
-        try:
-            done, pending = await asyncio.wait(
-                [
-                    asyncio.create_task(self.searcher.get_download_links(md5_hash)),
-                    asyncio.create_task(check_cancellation())
-                ],
-                return_when=asyncio.FIRST_COMPLETED,
-                timeout=self.download_links_timeout
-            )
-            
-            # Cancel any remaining tasks
-            for task in pending:
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
-            
-            # Check if cancellation was requested
-            if context.user_data.get('stop_search'):
-                await update.message.reply_text("🛑 Search stopped")
-                return None
-            
-            # Get the result from the completed download task
-            for task in done:
-                if not task.cancelled():
-                    try:
-                        result = task.result()
-                        if isinstance(result, list):  # This is the download links result
-                            return result
-                        elif isinstance(result, bool) and result:  # This is cancellation signal
-                            await update.message.reply_text("🛑 Search stopped")
-                            return None
-                    except Exception:
-                        pass
-            
-            # If we get here, something went wrong
-            return []
-            
-        except asyncio.TimeoutError:
-            logger.debug(f"Timeout fetching links for MD5: {md5_hash}")
-            return []
-        except Exception as e:
-            logger.debug(f"Error in cancellation-aware link fetching: {str(e)}")
-            return []
-
-    def _select_best_link(self, links: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-        """Select the best download link to send as a document."""
-        if not links:
-            return None
-        # Prefer direct mirror or resolved direct download with filename
-        def link_score(link: Dict[str, Any]) -> int:
-            score = 0
-            link_type = link.get('type', '')
-            if link_type in ['direct_mirror', 'direct_download']:
-                score += 2
-            if link.get('filename'):
-                score += 1
-            return score
-        return sorted(links, key=link_score, reverse=True)[0]
+        finally:
+            # Also runs when _stop_chat_workers cancels the lookup, so no placeholder is left pending
+            await links_msg.cancel()
 
     async def _send_document_from_url(self, update: Update, url: str, referer: Optional[str] = None, suggested_filename: Optional[str] = None) -> None:
         """Download a file from URL (with size cap) and send as Telegram document with proper filename."""
@@ -1011,32 +1003,29 @@ class TelegramLibGenBot:
                         caption=f"📄 {filename}"
                     )
         except Exception as e:
-            logger.debug(f"Failed to send document from URL {url}: {e}")
+            logger.debug("Failed to send document from URL %s: %s", url, e)
             # Silent failure; links are still provided
 
     def _extract_filename_from_disposition(self, content_disposition: str) -> Optional[str]:
         if not content_disposition:
             return None
-        match_ext = re.search(r"filename\*=(?:UTF-8''|)\s*([^;]+)", content_disposition, flags=re.IGNORECASE)
+        match_ext = FILENAME_EXT_RE.search(content_disposition)
         if match_ext:
             try:
-                from urllib.parse import unquote
                 return unquote(match_ext.group(1).strip('"'))
             except Exception:
                 return match_ext.group(1).strip('"')
-        match = re.search(r'filename="?([^";]+)"?', content_disposition, flags=re.IGNORECASE)
+        match = FILENAME_RE.search(content_disposition)
         if match:
             return match.group(1)
         return None
 
     def _infer_filename_from_url(self, url: str) -> Optional[str]:
         try:
-            from urllib.parse import urlparse, unquote
-            import os as _os
             path = urlparse(url).path
             if not path:
                 return None
-            name = _os.path.basename(path)
+            name = os.path.basename(path)
             name = unquote(name)
             return name if name else None
         except Exception:
@@ -1044,6 +1033,15 @@ class TelegramLibGenBot:
             
         
             
+    async def _post_shutdown(self, application: Application) -> None:
+        """Stop the chat workers and close the shared aiohttp session while the event loop is still running."""
+        # Workers first, since their jobs still use the HTTP session
+        await self._stop_chat_workers()
+        logger.info("Chat workers stopped")
+        
+        await self.http_client.aclose()
+        logger.info("Async HTTP session closed")
+        
     def run(self) -> None:
         """Start the bot with optimized concurrency settings."""
         logger.info("Starting Telegram LibGen Bot with concurrent processing...")
@@ -1051,22 +1049,26 @@ class TelegramLibGenBot:
         # Configure proxy if available
         http_proxy = os.getenv('HTTP_PROXY')
         https_proxy = os.getenv('HTTPS_PROXY')
+        proxy_url = https_proxy or http_proxy
+        if proxy_url:
+            logger.info(f"🔧 Using HTTP proxy: {proxy_url}")
+        
+        # One pooled HTTPXRequest for the bot's lifetime, with or without a proxy
+        # HTTP/2 multiplexes concurrent Bot API calls over one TLS connection
+        request = HTTPXRequest(
+            connection_pool_size=100,  # Increased connection pool
+            proxy_url=proxy_url,
+            read_timeout=30,
+            write_timeout=30,
+            connect_timeout=30,
+            pool_timeout=5,
+            http_version="2"
+        )
         
-        if http_proxy or https_proxy:
-            logger.info(f"🔧 Using HTTP proxy: {https_proxy or http_proxy}")
-            proxy_url = https_proxy or http_proxy
-            # Create HTTPXRequest with proper proxy configuration
-            request = HTTPXRequest(proxy_url=proxy_url)
-            application = Application.builder().token(self.token).request(request).build()
-        else:
-            # Use optimized HTTPXRequest for better concurrency
-            request = HTTPXRequest(
-                connection_pool_size=100,  # Increased connection pool
-                read_timeout=30,
-                write_timeout=30,
-                connect_timeout=30
-            )
-            application = Application.builder().token(self.token).request(request).build()
+        # Throttle every outbound Bot API call below Telegram's ~30 msg/s bot-wide limit,
+        # retrying once on RetryAfter instead of failing the send
+        rate_limiter = AIORateLimiter(overall_max_rate=self.max_messages_per_second, overall_time_period=1, max_retries=1)
+        application = Application.builder().token(self.token).request(request).rate_limiter(rate_limiter).post_shutdown(self._post_shutdown).build()
         
         # Add handlers based on feature flags
         application.add_handler(CommandHandler("start", self.start_command))
@@ -1078,7 +1080,8 @@ class TelegramLibGenBot:
             application.add_handler(CommandHandler("stop", self.stop_command))
             
         if self.feature_pagination:
-            application.add_handler(CallbackQueryHandler(self.handle_callback_query))
+            # Malformed callback data is rejected by the dispatcher before reaching the handler
+            application.add_handler(CallbackQueryHandler(self.handle_callback_query, pattern=_CALLBACK_DATA_RE))
             
         application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_message))
         
@@ -1086,6 +1089,22 @@ class TelegramLibGenBot:
         logger.info("Configuring bot for concurrent processing...")
         logger.info(f"Max connections: 100, Keep-alive: 20, Timeout: 30s")
         
+        # Webhooks wake the bot only when Telegram has an update; polling is the local-dev fallback
+        webhook_url = os.getenv('WEBHOOK_URL', '').strip().rstrip('/')
+        if webhook_url:
+            logger.info(f"Bot is running with webhook {webhook_url}/<token>...")
+            application.run_webhook(
+                listen=os.getenv('WEBHOOK_LISTEN', '0.0.0.0'),
+                port=int(os.getenv('PORT', '8443')),
+                url_path=self.token,
+                webhook_url=f"{webhook_url}/{self.token}",
+                # Telegram echoes this in a header so forged POSTs to the webhook are rejected
+                secret_token=os.getenv('WEBHOOK_SECRET') or None,
+                allowed_updates=Update.ALL_TYPES,
+                drop_pending_updates=True  # Clear any pending updates
+            )
+            return
+        
         # Start the bot with optimized polling settings
         logger.info("Bot is running with concurrent processing enabled...")
         application.run_polling(
@@ -1104,6 +1123,10 @@ def main():
         print("❌ Error: Please set TELEGRAM_BOT_TOKEN in your .env file")
         return
         
+    # Must happen before run_polling() creates the event loop
+    if install_uvloop():
+        logger.info("⚡ Using uvloop event loop")
+        
     # Create and run bot
     bot = TelegramLibGenBot(bot_token)
     
@@ -8,21 +8,174 @@ import asyncio
 import aiohttp
 import re
 import os
+import sys
+import ssl
 import time
-from typing import List, Dict, Any, Optional
-from urllib.parse import quote, urljoin
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urljoin, urlparse, parse_qs, unquote
 from bs4 import BeautifulSoup
-import logging
 from dotenv import load_dotenv
 
 from .utils.logger import setup_logger
 from .utils.http_client import get_http_client, record_request_performance
+from .utils.event_loop import install_uvloop
 
 # Load environment variables
 load_dotenv()
 
 logger = setup_logger(__name__)
 
+# Additional download sources tried after the LibGen mirrors, in priority order.
+# Each entry is (url templates, link type, name, text); "{i}" is the 1-based variant number.
+_ADDITIONAL_SOURCES = (
+    # Library.lol direct links with multiple variants
+    (
+        (
+            "http://library.lol/main/{md5}",
+            "https://library.lol/main/{md5}",
+            "http://libgen.lc/main/{md5}",
+            "https://libgen.lc/main/{md5}",
+            "http://libgen.lc/book/index.php?md5={md5}",
+            "https://libgen.lc/book/index.php?md5={md5}",
+            "http://libgen.lc/get.php?md5={md5}",
+            "https://libgen.lc/get.php?md5={md5}",
+        ),
+        'library_lol', 'Library.lol {i}', 'Library.lol Variant {i}'
+    ),
+    # Anna's Archive links (Rank #2 - Meta-search engine aggregating LibGen, Sci-Hub, Z-Library)
+    (
+        (
+            "https://annas-archive.org/md5/{md5}",
+            "https://annas-archive.li/md5/{md5}",
+            "https://annas-archive.se/md5/{md5}",
+            "https://annas-archive.org/md5/{md5}",
+            "https://annas-archive.li/md5/{md5}",
+        ),
+        'annas_archive', "Anna's Archive {i}", 'Meta-Search Engine'
+    ),
+    # Z-Library links (Rank #3 - Large database, good performance)
+    (
+        (
+            "https://z-library.sk/md5/{md5}",
+            "https://z-lib.org/md5/{md5}",
+            "https://b-ok.org/md5/{md5}",
+            "https://booksc.eu/md5/{md5}",
+        ),
+        'z_library', 'Z-Library {i}', 'Comprehensive Shadow Library'
+    ),
+    # Ocean of PDF links (Rank #4 - Clean interface, quick downloads)
+    (
+        (
+            "https://oceanofpdf.com/?s={md5}",
+            "https://oceanofpdf.com/search/{md5}",
+        ),
+        'ocean_pdf', 'Ocean of PDF {i}', 'Clean Interface'
+    ),
+    # Liber3 links (Rank #5 - Fast and typically ad-free)
+    (
+        (
+            "https://liber3.eth.limo/search?q={md5}",
+        ),
+        'liber3', 'Liber3', 'Fast & Ad-Free'
+    ),
+    # Memory of the World links (Rank #6 - Solid fallback option)
+    (
+        (
+            "https://library.memoryoftheworld.org/search?q={md5}",
+            "https://library.memoryoftheworld.org/md5/{md5}",
+        ),
+        'memory_world', 'Memory of the World {i}', 'Minimal Overhead'
+    ),
+    # Sci-Hub links (Rank #7 - Academic papers and books)
+    (
+        (
+            "https://sci-hub.se/{md5}",
+            "https://sci-hub.st/{md5}",
+            "https://sci-hub.ru/{md5}",
+        ),
+        'scihub', 'Sci-Hub {i}', 'Academic Papers'
+    ),
+    # Direct download links (Rank #8 - Direct file access)
+    (
+        (
+            "https://libgen.lc/get.php?md5={md5}",
+            "http://libgen.lc/get.php?md5={md5}",
+            "https://library.lol/get.php?md5={md5}",
+            "http://library.lol/get.php?md5={md5}",
+        ),
+        'direct_download', 'Direct Download {i}', 'Direct File Access'
+    ),
+    # Direct LibGen mirror links (Updated September 2025 - comprehensive list)
+    (
+        (
+            # Active Mirrors (Sep 2025) - Primary
+            "https://libgen.li/book/index.php?md5={md5}",
+            "https://libgen.la/book/index.php?md5={md5}",
+            "https://libgen.gl/book/index.php?md5={md5}",
+            "https://libgen.vg/book/index.php?md5={md5}",
+            "https://libgen.bz/book/index.php?md5={md5}",
+            "https://libgen.is/book/index.php?md5={md5}",
+            # Russian LibGen-related Mirrors
+            "http://libgen.rs/book/index.php?md5={md5}",
+            "http://gen.lib.rus.ec/book/index.php?md5={md5}",
+            "https://libgen.fun/book/index.php?md5={md5}",
+        ),
+        'libgen_direct', 'LibGen Direct', 'LibGen Mirror'
+    ),
+    # CyberLeninka (Legal Russian Repository for scientific papers)
+    (
+        (
+            "https://cyberleninka.ru/search?q={md5}",
+        ),
+        'cyberleninka', 'CyberLeninka', 'Legal Russian Repository'
+    ),
+)
+
+# Flattened once at import: (url template, type, name, text) per source link
+_ADDITIONAL_SOURCE_TEMPLATES = tuple(
+    (url_template, link_type, name.format(i=i), text.format(i=i))
+    for url_templates, link_type, name, text in _ADDITIONAL_SOURCES
+    for i, url_template in enumerate(url_templates, 1)
+)
+
+# The shared aiohttp connector is built with ssl=False, so requests that should verify
+# certificates pass this context explicitly (a per-request ssl=True would not override it)
+_VERIFIED_SSL = ssl.create_default_context()
+
+# Accepted spellings of an enabled boolean setting; bot.py parses its flags with it too
+TRUTHY_VALUES = frozenset({'1', 'true', 'yes', 'on'})
+
+# Upper bound of the per-mirror health counter; 0 means healthy
+_MAX_MIRROR_HEALTH = 8
+
+# Mirrors serving get.php that a resolved download link is re-pointed at for true diversity
+_GET_PHP_MIRRORS = (
+    'https://libgen.li', 'https://libgen.gl', 'https://libgen.vg',
+    'https://libgen.bz', 'https://libgen.is', 'https://libgen.pw',
+    'https://libgen.ee', 'http://libgen.rs', 'http://gen.lib.rus.ec',
+    'https://libgen.fun', 'https://libgen.st', 'http://library.lol'
+)
+
+# Patterns used while parsing search pages and download pages, compiled once at import
+_MD5_QUERY_RE = re.compile(r'^[a-f0-9]{32}$')
+_MD5_PARAM_RE = re.compile(r'md5=([a-f0-9]{32})')
+_MD5_TOKEN_RE = re.compile(r'\b([a-f0-9]{32})\b')
+_LEADING_ARTICLE_RE = re.compile(r'^(A |An |The )', re.IGNORECASE)
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_DIRECT_MIRROR_RES = (
+    re.compile(r'https?://(?:[\w.-]*cloudflare|cfcdn)[\w.-]*/[^\s\"]+', re.I),
+    re.compile(r'https?://ipfs\.[\w.-]+/[^\s\"]+', re.I),
+    re.compile(r'https?://(?:[\w.-]*cdn)[\w.-]*/[^\s\"]+', re.I),
+)
+_GET_PHP_RE = re.compile(r'get\.php\?md5=[a-f0-9]{32}&key=\w+')
+_FILE_PHP_RE = re.compile(r'/file\.php\?id=\d+')
+_DOWNLOAD_TEXT_RE = re.compile(r'download|get|mirror', re.I)
+
+# Content-Disposition filename patterns, shared with bot.py's document download
+FILENAME_EXT_RE = re.compile(r"filename\*=(?:UTF-8''|)\s*([^;]+)", re.IGNORECASE)
+FILENAME_RE = re.compile(r'filename="?([^";]+)"?', re.IGNORECASE)
+
 class LibGenSearcher:
     """Main class for searching LibGen sites."""
     
@@ -46,10 +199,22 @@ class LibGenSearcher:
         self.mirror_reliability = {}
         self.mirror_response_times = {}
         self.failed_mirrors = set()
+        
+        # Local health counter per mirror (0.._MAX_MIRROR_HEALTH) that scales its search timeout
+        self.mirror_health: Dict[str, int] = {}
+        self.mirror_timeout_base = float(os.getenv('LIBGEN_MIRROR_TIMEOUT_BASE', '8'))
 
         # Control whether to resolve get.php links to final URLs and filenames
         resolve_env = os.getenv('LIBGEN_RESOLVE_FINAL_URLS', 'true').strip().lower()
-        self.resolve_final_urls = resolve_env in ['1', 'true', 'yes', 'on']
+        self.resolve_final_urls = resolve_env in TRUTHY_VALUES
+        
+        # Maximum number of download-link probes in flight at once
+        self.link_check_concurrency = int(os.getenv('LIBGEN_LINK_CHECK_CONCURRENCY', '16'))
+        
+        # Maximum number of uncached searches and link lookups hitting the mirrors at once.
+        # The semaphore is created on first use so it binds to the running event loop.
+        self.upstream_concurrency = int(os.getenv('LIBGEN_CONCURRENCY', '16'))
+        self._upstream_semaphore: Optional[asyncio.Semaphore] = None
         
         # Initialize optimized HTTP client
         self.http_client = get_http_client()
@@ -60,12 +225,27 @@ class LibGenSearcher:
             'successful_searches': 0,
             'failed_searches': 0,
             'average_search_time': 0.0,
-            'mirror_performance': {}
+            'mirror_performance': {},
+            'cache_hits': 0,
+            'cache_misses': 0
         }
         
-        # Simple in-memory cache for search results (TTL: 5 minutes)
+        # Simple in-memory cache for search results (TTL: 5 minutes by default)
         self.search_cache = {}
-        self.cache_ttl = 300  # 5 minutes
+        self.cache_ttl = int(os.getenv('LIBGEN_CACHE_TTL', '300'))
+        self.cache_max_entries = int(os.getenv('LIBGEN_CACHE_MAX_ENTRIES', '512'))
+        
+        # Per-query locks so concurrent misses for the same query share one upstream search
+        self._search_locks: Dict[str, asyncio.Lock] = {}
+        
+        # Download links cache keyed by MD5 (TTL: 10 minutes by default), with the same coalescing
+        self.links_cache = {}
+        self.links_cache_ttl = int(os.getenv('LIBGEN_LINKS_CACHE_TTL', '600'))
+        self._links_locks: Dict[str, asyncio.Lock] = {}
+        
+        # Negative cache: MD5s whose last mirror sweep found no links (TTL: 1 hour by default)
+        self.no_links_cache = {}
+        self.no_links_cache_ttl = int(os.getenv('LIBGEN_NO_LINKS_CACHE_TTL', '3600'))
         
         logger.info(f"Initialized with {len(self.libgen_mirrors)} search mirrors (Comprehensive Sep 2025): {', '.join(self.libgen_mirrors)}")
         logger.info(f"Initialized with {len(self.download_mirrors)} download mirrors (Comprehensive Sep 2025): {', '.join(self.download_mirrors)}")
@@ -89,8 +269,7 @@ class LibGenSearcher:
             max_results = int(os.getenv('LIBGEN_MAX_RESULTS', '200'))
             
         # Check if query is an MD5 hash (32 hex characters)
-        import re
-        if re.match(r'^[a-f0-9]{32}$', query.lower()):
+        if _MD5_QUERY_RE.match(query.lower()):
             logger.info(f"🔍 MD5 hash detected: {query}")
             # For MD5 searches, try to get download links directly
             try:
@@ -116,20 +295,33 @@ class LibGenSearcher:
                 return []
             
         # Check cache first
-        cache_key = f"{query.lower().strip()}:{max_results}"
-        current_time = time.time()
-        
-        if cache_key in self.search_cache:
-            cached_data, cache_time = self.search_cache[cache_key]
-            if current_time - cache_time < self.cache_ttl:
-                logger.info(f"Cache hit for query: {query}")
-                return cached_data
-            else:
-                # Remove expired cache entry
-                del self.search_cache[cache_key]
-        
+        # Case and spacing variants of a query share one entry ("Clean  Code" == "clean code")
+        cache_key = f"{' '.join(query.casefold().split())}:{max_results}"
+        cached_results = self._get_cached_search(cache_key)
+        if cached_results is not None:
+            logger.info(f"Cache hit for query: {query}")
+            return cached_results
+        
+        # Coalesce concurrent misses for the same query into a single upstream search
+        lock = self._search_locks.setdefault(cache_key, asyncio.Lock())
+        try:
+            async with lock:
+                cached_results = self._get_cached_search(cache_key)
+                if cached_results is not None:
+                    logger.info(f"Cache hit for query after in-flight search: {query}")
+                    return cached_results
+                
+                self.search_stats['cache_misses'] += 1
+                async with self._upstream_slot():
+                    return await self._search_uncached(query, max_results, cache_key)
+        finally:
+            if not lock.locked():
+                self._search_locks.pop(cache_key, None)
+    
+    async def _search_uncached(self, query: str, max_results: int, cache_key: str) -> List[Dict[str, Any]]:
+        """Search the mirrors for a query and store the results in the cache."""
         # Track search performance
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.search_stats['total_searches'] += 1
         
         logger.info(f"Searching for: {query}")
@@ -145,14 +337,16 @@ class LibGenSearcher:
         for i, mirror in enumerate(prioritized_mirrors[:5]):  # Try first 5 mirrors
             logger.info(f"🔄 Attempt {i + 1}/5: Trying {mirror}...")
             
+            mirror_timeout = self._get_mirror_timeout(mirror)
             try:
-                # Search this mirror with 8-second timeout
+                # Search this mirror with a timeout scaled by its recent health
                 result = await asyncio.wait_for(
                     self._search_mirror_async(mirror, query),
-                    timeout=8.0
+                    timeout=mirror_timeout
                 )
                 
                 if result and len(result) > 0:
+                    self._update_mirror_health(mirror, True)
                     results = result
                     logger.info(f"✅ SUCCESS! Got {len(result)} results from {mirror}")
                     break
@@ -160,9 +354,11 @@ class LibGenSearcher:
                     logger.info(f"⚠️ No results from {mirror}, trying next...")
                     
             except asyncio.TimeoutError:
-                logger.warning(f"⏰ Timeout on {mirror} (8s), trying next...")
+                self._update_mirror_health(mirror, False)
+                logger.warning(f"⏰ Timeout on {mirror} ({mirror_timeout:.1f}s), trying next...")
                 continue
             except Exception as e:
+                self._update_mirror_health(mirror, False)
                 logger.warning(f"❌ Error from {mirror}: {e}, trying next...")
                 continue
                 
@@ -176,7 +372,7 @@ class LibGenSearcher:
         total_found = len(results)
         unique_found = len(unique_results)
         returned = len(final_results)
-        search_time = time.time() - start_time
+        search_time = time.perf_counter() - start_time
         
         logger.info(f"Total results found: {total_found} from {len(self.libgen_mirrors)} mirrors")
         logger.info(f"Unique results after deduplication: {unique_found}")
@@ -184,7 +380,7 @@ class LibGenSearcher:
         logger.info(f"Search completed in {search_time:.2f}s for query: '{query}'")
         
         # Update performance stats
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         if final_results:
             self.search_stats['successful_searches'] += 1
         else:
@@ -197,66 +393,88 @@ class LibGenSearcher:
             (current_avg * (total_searches - 1) + total_time) / total_searches
         )
         
-        # Cache the results
+        # Cache the results, stamped with the time they were fetched
+        current_time = time.time()
         self.search_cache[cache_key] = (final_results, current_time)
         
-        # Clean up old cache entries
-        self._cleanup_cache()
+        # Clean up old cache entries against the same clock reading
+        self._cleanup_cache(self.search_cache, self.cache_ttl, current_time)
         
         logger.info(f"Total unique results: {len(final_results)} (search time: {total_time:.2f}s)")
-        record_request_performance(f"search:{query}", total_time)
+        record_request_performance("libgen://libgen_search", total_time)
         
         return final_results
     
-    def _cleanup_cache(self):
-        """Remove expired cache entries."""
-        current_time = time.time()
+    def _get_cached_search(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
+        """Return cached results for a key if they are still fresh."""
+        cached = self.search_cache.get(cache_key)
+        if cached is None:
+            return None
+        
+        cached_data, cache_time = cached
+        if time.time() - cache_time >= self.cache_ttl:
+            # Remove expired cache entry
+            del self.search_cache[cache_key]
+            return None
+        
+        self.search_stats['cache_hits'] += 1
+        return cached_data
+    
+    def _cleanup_cache(self, cache: Dict[str, tuple], ttl: int, current_time: float):
+        """Remove expired cache entries and evict the oldest ones beyond the size limit."""
         expired_keys = [
-            key for key, (_, cache_time) in self.search_cache.items()
-            if current_time - cache_time > self.cache_ttl
+            key for key, (_, cache_time) in cache.items()
+            if current_time - cache_time > ttl
         ]
         for key in expired_keys:
-            del self.search_cache[key]
+            del cache[key]
+        
+        # Dicts keep insertion order, so the first keys are the oldest entries
+        evicted = 0
+        while len(cache) > self.cache_max_entries:
+            del cache[next(iter(cache))]
+            evicted += 1
         
-        if expired_keys:
-            logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
+        if expired_keys or evicted:
+            logger.debug("Cleaned up %s expired and %s evicted cache entries", len(expired_keys), evicted)
         
     async def _search_mirror_async(self, mirror: str, query: str) -> List[Dict[str, Any]]:
-        """Search a specific LibGen mirror asynchronously with reliability tracking."""
+        """
+        Search a specific LibGen mirror asynchronously with reliability tracking.
+        
+        Raises:
+            aiohttp.ClientError: If every attempt got an HTTP error or failed to connect
+        """
         search_url = f"{mirror}/index.php"
-        params = {
-            'req': query,
-            'columns[]': ['t', 'a', 's', 'y', 'p', 'i'],  # Title, Author, Series, Year, Publisher, ISBN
-            'objects[]': ['f', 'e', 's', 'a', 'p', 'w'],  # Files, Editions, Series, Authors, Publishers, Works
-            'topics[]': ['l', 'c', 'f', 'a', 'm', 'r', 's'],  # All topics
-            'res': str(int(os.getenv('LIBGEN_MIRROR_REQUEST_LIMIT', '1000'))),  # Search all available results
-            'filesuns': 'all',
-            'curtab': 'f'  # Files tab
-        }
+        params = self._build_search_params(query)
         
         # Use optimized HTTP client with SSL verification bypass for problematic mirrors
         ssl_verify = not any(problematic in mirror for problematic in ['libgen.fun', 'libgen.rs'])
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         success = False
         response_time = 0
+        last_error = None
         
         for attempt in range(self.max_retries):
             try:
-                response = self.http_client.get(search_url, params=params, verify=ssl_verify)
-                response_time = time.time() - start_time
-                
-                if response.status_code == 200:
-                    html = response.text
-                    results = self._parse_search_results(html, mirror)
-                    success = True
-                    logger.info(f"✅ Success from {mirror} in {response_time:.2f}s: {len(results)} results")
-                    return results
-                else:
-                    logger.warning(f"HTTP {response.status_code} from {mirror}")
+                session = await self.http_client.get_aio_session()
+                async with session.get(search_url, params=params, ssl=_VERIFIED_SSL if ssl_verify else False) as response:
+                    response_time = time.perf_counter() - start_time
+                    
+                    if response.status == 200:
+                        html = await response.text()
+                        results = self._parse_search_results(html, mirror)
+                        success = True
+                        logger.info(f"✅ Success from {mirror} in {response_time:.2f}s: {len(results)} results")
+                        return results
+                    else:
+                        last_error = f"HTTP {response.status}"
+                        logger.warning(f"HTTP {response.status} from {mirror}")
                     
             except Exception as e:
-                response_time = time.time() - start_time
+                response_time = time.perf_counter() - start_time
+                last_error = str(e) or type(e).__name__
                 logger.warning(f"Request error on attempt {attempt + 1} for {mirror}: {str(e)}")
                 
             if attempt < self.max_retries - 1:
@@ -265,43 +483,22 @@ class LibGenSearcher:
         # Update reliability tracking
         self._update_mirror_reliability(mirror, success, response_time)
         
-        if not success:
-            logger.warning(f"❌ All attempts failed for {mirror}")
-        
-        return []
+        # Let the caller count this against the mirror's health, like a timeout
+        logger.warning(f"❌ All attempts failed for {mirror}")
+        raise aiohttp.ClientError(f"All attempts failed for {mirror}: {last_error}")
 
-    async def _search_mirror(self, mirror: str, query: str, max_results: int) -> List[Dict[str, Any]]:
-        """Search a specific LibGen mirror using the correct index.php pattern."""
-        search_url = f"{mirror}/index.php"
-        params = {
-            'req': query,
-            'columns[]': ['t', 'a', 's', 'y', 'p', 'i'],  # Title, Author, Series, Year, Publisher, ISBN
-            'objects[]': ['f', 'e', 's', 'a', 'p', 'w'],  # Files, Editions, Series, Authors, Publishers, Works
-            'topics[]': ['l', 'c', 'f', 'a', 'm', 'r', 's'],  # All topics
-            'res': str(int(os.getenv('LIBGEN_MIRROR_REQUEST_LIMIT', '1000'))),  # Search all available results
-            'filesuns': 'all',
-            'curtab': 'f'  # Files tab
-        }
-        
-        # Use optimized HTTP client with SSL verification bypass for problematic mirrors
-        ssl_verify = not any(problematic in mirror for problematic in ['libgen.fun', 'libgen.rs'])
-        
-        for attempt in range(self.max_retries):
-            try:
-                response = self.http_client.get(search_url, params=params, verify=ssl_verify)
-                if response.status_code == 200:
-                    html = response.text
-                    return self._parse_search_results(html, mirror)
-                else:
-                    logger.warning(f"HTTP {response.status_code} from {mirror}")
-                    
-            except Exception as e:
-                logger.warning(f"Request error on attempt {attempt + 1} for {mirror}: {str(e)}")
-                
-            if attempt < self.max_retries - 1:
-                await asyncio.sleep(1)  # Brief delay before retry
-                    
-        return []
+    def _build_search_params(self, query: str) -> List[tuple]:
+        """Build index.php query parameters (repeated keys for the [] fields)."""
+        params = [('req', query)]
+        params += [('columns[]', c) for c in ('t', 'a', 's', 'y', 'p', 'i')]  # Title, Author, Series, Year, Publisher, ISBN
+        params += [('objects[]', o) for o in ('f', 'e', 's', 'a', 'p', 'w')]  # Files, Editions, Series, Authors, Publishers, Works
+        params += [('topics[]', t) for t in ('l', 'c', 'f', 'a', 'm', 'r', 's')]  # All topics
+        params += [
+            ('res', str(int(os.getenv('LIBGEN_MIRROR_REQUEST_LIMIT', '1000')))),  # Search all available results
+            ('filesuns', 'all'),
+            ('curtab', 'f')  # Files tab
+        ]
+        return params
         
     def _parse_search_results(self, html: str, base_url: str) -> List[Dict[str, Any]]:
         """Parse HTML search results into structured data."""
@@ -371,7 +568,7 @@ class LibGenSearcher:
                         href = link.get('href', '')
                         
                         # Look for MD5 hash in any URL parameter
-                        md5_match = re.search(r'md5=([a-f0-9]{32})', href)
+                        md5_match = _MD5_PARAM_RE.search(href)
                         if md5_match and not md5_hash:
                             md5_hash = md5_match.group(1)
                             book_info['md5'] = md5_hash
@@ -407,7 +604,7 @@ class LibGenSearcher:
                         for cell in cells:
                             cell_text = cell.get_text()
                             cell_html = str(cell)
-                            md5_match = re.search(r'\b([a-f0-9]{32})\b', cell_text + ' ' + cell_html)
+                            md5_match = _MD5_TOKEN_RE.search(cell_text + ' ' + cell_html)
                             if md5_match:
                                 md5_hash = md5_match.group(1)
                                 book_info['md5'] = md5_hash
@@ -420,7 +617,7 @@ class LibGenSearcher:
                         results.append(book_info)
                         
                 except Exception as e:
-                    logger.debug(f"Error parsing result row: {str(e)}")
+                    logger.debug("Error parsing result row: %s", e)
                     continue
                     
         except Exception as e:
@@ -433,7 +630,7 @@ class LibGenSearcher:
         # Clean title
         title = book_info.get('title', '').strip()
         # Remove common prefixes/suffixes that clutter results
-        title = re.sub(r'^(A |An |The )', '', title, flags=re.IGNORECASE)
+        title = _LEADING_ARTICLE_RE.sub('', title)
         book_info['title'] = title
         
         # Clean author
@@ -442,7 +639,7 @@ class LibGenSearcher:
         
         # Normalize year
         year = book_info.get('year', '').strip()
-        year_match = re.search(r'\b(19|20)\d{2}\b', year)
+        year_match = _YEAR_RE.search(year)
         book_info['year'] = year_match.group(0) if year_match else year
         
         # Clean size
@@ -463,6 +660,9 @@ class LibGenSearcher:
         """
         Get direct download links for a book using its MD5 hash.
         Tries mirrors one by one and returns first successful result.
+        Non-empty results are cached per MD5 for LIBGEN_LINKS_CACHE_TTL seconds,
+        empty ones for LIBGEN_NO_LINKS_CACHE_TTL seconds, but only if a mirror
+        actually answered (an outage where every mirror fails is not cached).
         
         Args:
             md5_hash: MD5 hash of the book
@@ -470,46 +670,118 @@ class LibGenSearcher:
         Returns:
             List of download link dictionaries
         """
+        cache_key = md5_hash.lower()
+        cached_links = self._get_cached_links(cache_key)
+        if cached_links is not None:
+            logger.info(f"Cache hit for download links: {md5_hash}")
+            return cached_links
+        
+        # Coalesce concurrent requests for the same book into a single mirror sweep
+        lock = self._links_locks.setdefault(cache_key, asyncio.Lock())
+        try:
+            async with lock:
+                cached_links = self._get_cached_links(cache_key)
+                if cached_links is not None:
+                    return cached_links
+                
+                async with self._upstream_slot():
+                    download_links, mirrors_answered = await self._get_download_links_uncached(md5_hash)
+                current_time = time.time()
+                if download_links:
+                    self.links_cache[cache_key] = (download_links, current_time)
+                    self._cleanup_cache(self.links_cache, self.links_cache_ttl, current_time)
+                elif mirrors_answered:
+                    self.no_links_cache[cache_key] = (download_links, current_time)
+                    self._cleanup_cache(self.no_links_cache, self.no_links_cache_ttl, current_time)
+                return download_links
+        finally:
+            if not lock.locked():
+                self._links_locks.pop(cache_key, None)
+    
+    @asynccontextmanager
+    async def _upstream_slot(self):
+        """Hold one of the LIBGEN_CONCURRENCY upstream slots, recording how long it took to get one."""
+        if self._upstream_semaphore is None:
+            self._upstream_semaphore = asyncio.Semaphore(self.upstream_concurrency)
+        
+        wait_start = time.perf_counter()
+        async with self._upstream_semaphore:
+            wait_time = time.perf_counter() - wait_start
+            record_request_performance("libgen://libgen_semaphore_wait", wait_time)
+            if wait_time > 0.1:
+                logger.debug("Waited %.2fs for an upstream slot", wait_time)
+            yield
+    
+    def _get_cached_links(self, cache_key: str) -> Optional[List[Dict[str, str]]]:
+        """Return cached download links for an MD5 if they are still fresh (an empty list if none exist)."""
+        current_time = time.time()
+        for cache, ttl in ((self.links_cache, self.links_cache_ttl), (self.no_links_cache, self.no_links_cache_ttl)):
+            cached = cache.get(cache_key)
+            if cached is None:
+                continue
+            
+            cached_links, cache_time = cached
+            if current_time - cache_time >= ttl:
+                del cache[cache_key]
+                continue
+            
+            return cached_links
+        
+        return None
+    
+    async def _get_download_links_uncached(self, md5_hash: str) -> Tuple[List[Dict[str, str]], int]:
+        """
+        Collect download links for an MD5 from the mirrors and additional sources.
+        
+        Returns:
+            The links, and how many mirrors answered without a timeout or error
+        """
         download_links = []
+        mirrors_answered = 0
         
         # Try multiple mirrors to get diverse download sources
         print(f"🔗 Collecting links from multiple mirrors for variety...")
         successful_mirrors = 0
         max_mirrors = 5  # Try up to 5 mirrors for variety
         
-        for i, mirror in enumerate(self.download_mirrors[:max_mirrors]):
-            try:
-                logger.info(f"🔗 Getting download links from mirror {i+1}/{max_mirrors}: {mirror}")
-                print(f"🔗 Mirror {i+1}/{max_mirrors}: {mirror}")
-                
-                # Try to get final download links following LibGen's pattern
-                links = await asyncio.wait_for(
-                    self._get_final_download_links(mirror, md5_hash), 
-                    timeout=3.0  # 3 seconds per mirror for speed
-                )
-                
-                if links:
-                    download_links.extend(links)
-                    successful_mirrors += 1
-                    logger.info(f"✅ Found {len(links)} download links from {mirror}")
-                    print(f"✅ Found {len(links)} links from {mirror} (Total: {len(download_links)})")
-                    
-                    # If we have enough links from different sources, we can return early
-                    if len(download_links) >= 8 and successful_mirrors >= 2:
-                        print(f"🚀 Got {len(download_links)} links from {successful_mirrors} mirrors - returning diverse set")
-                        break
-                else:
-                    logger.info(f"⚠️ No links from {mirror}, trying next...")
-                    print(f"⚠️ No links from {mirror}, trying next...")
-                
-            except asyncio.TimeoutError:
-                logger.warning(f"⏰ Timeout getting links from {mirror}, trying next...")
-                print(f"⏰ Timeout from {mirror}, trying next...")
+        mirrors = self.download_mirrors[:max_mirrors]
+        logger.info(f"🔗 Getting download links from {len(mirrors)} mirrors concurrently")
+        print(f"🔗 Querying {len(mirrors)} mirrors concurrently...")
+        
+        # Query all mirrors at once; each is still capped at 3 seconds for speed
+        mirror_results = await asyncio.gather(
+            *[
+                asyncio.wait_for(self._get_final_download_links(mirror, md5_hash), timeout=3.0)
+                for mirror in mirrors
+            ],
+            return_exceptions=True
+        )
+        
+        # Merge in mirror priority order so the result matches the sequential walk
+        for mirror, links in zip(mirrors, mirror_results):
+            if isinstance(links, asyncio.TimeoutError):
+                logger.warning(f"⏰ Timeout getting links from {mirror}")
+                print(f"⏰ Timeout from {mirror}")
                 continue
-            except Exception as e:
-                logger.warning(f"❌ Error getting links from {mirror}: {str(e)}, trying next...")
-                print(f"❌ Error from {mirror}: {str(e)}, trying next...")
+            if isinstance(links, Exception):
+                logger.warning(f"❌ Error getting links from {mirror}: {str(links)}")
+                print(f"❌ Error from {mirror}: {str(links)}")
                 continue
+            
+            mirrors_answered += 1
+            if links:
+                download_links.extend(links)
+                successful_mirrors += 1
+                logger.info(f"✅ Found {len(links)} download links from {mirror}")
+                print(f"✅ Found {len(links)} links from {mirror} (Total: {len(download_links)})")
+                
+                # If we have enough links from different sources, stop merging
+                if len(download_links) >= 8 and successful_mirrors >= 2:
+                    print(f"🚀 Got {len(download_links)} links from {successful_mirrors} mirrors - returning diverse set")
+                    break
+            else:
+                logger.info(f"⚠️ No links from {mirror}")
+                print(f"⚠️ No links from {mirror}")
         
         print(f"🎯 Final result: {len(download_links)} links from {successful_mirrors} mirrors")
         
@@ -518,186 +790,41 @@ class LibGenSearcher:
         # If no links found from mirrors, try additional sources
         additional_links = await self._get_additional_download_sources(md5_hash)
         
-        # Test additional links before adding them
+        # Test additional links concurrently before adding them (order is preserved)
         verified_additional_links = []
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10.0)) as session:
-            for link in additional_links:
-                if await self._test_download_link(session, link['url']):
-                    verified_additional_links.append(link)
-                    logger.info(f"✅ Verified additional link: {link['name']}")
-                else:
-                    logger.info(f"❌ Additional link failed verification: {link['name']}")
+        session = await self.http_client.get_aio_session()
+        probe_semaphore = asyncio.Semaphore(self.link_check_concurrency)
+        
+        async def bounded_check(url: str) -> bool:
+            async with probe_semaphore:
+                return await self._test_download_link(session, url)
+        
+        link_checks = await asyncio.gather(
+            *[bounded_check(link['url']) for link in additional_links],
+            return_exceptions=True
+        )
+        for link, is_valid in zip(additional_links, link_checks):
+            if is_valid is True:
+                verified_additional_links.append(link)
+                logger.info(f"✅ Verified additional link: {link['name']}")
+            else:
+                logger.info(f"❌ Additional link failed verification: {link['name']}")
         
         download_links.extend(verified_additional_links)
                 
-        return download_links
+        return download_links, mirrors_answered
         
     async def _get_additional_download_sources(self, md5_hash: str) -> List[Dict[str, str]]:
         """Get additional download sources for a book using various methods."""
-        additional_links = []
-        
-        # Add Library.lol direct links with multiple variants
-        library_lol_links = [
-            f"http://library.lol/main/{md5_hash}",
-            f"https://library.lol/main/{md5_hash}",
-            f"http://libgen.lc/main/{md5_hash}",
-            f"https://libgen.lc/main/{md5_hash}",
-            f"http://libgen.lc/book/index.php?md5={md5_hash}",
-            f"https://libgen.lc/book/index.php?md5={md5_hash}",
-            f"http://libgen.lc/get.php?md5={md5_hash}",
-            f"https://libgen.lc/get.php?md5={md5_hash}",
-        ]
-        
-        for i, url in enumerate(library_lol_links):
-            additional_links.append({
-                'url': url,
-                'type': 'library_lol',
-                'name': f'Library.lol {i+1}',
-                'text': f'Library.lol Variant {i+1}'
-            })
-        
-        # Add Anna's Archive links (Rank #2 - Meta-search engine aggregating LibGen, Sci-Hub, Z-Library)
-        annas_archive_links = [
-            f"https://annas-archive.org/md5/{md5_hash}",
-            f"https://annas-archive.li/md5/{md5_hash}",
-            f"https://annas-archive.se/md5/{md5_hash}",
-            f"https://annas-archive.org/md5/{md5_hash}",
-            f"https://annas-archive.li/md5/{md5_hash}",
-        ]
-        
-        for i, url in enumerate(annas_archive_links):
-            additional_links.append({
-                'url': url,
-                'type': 'annas_archive',
-                'name': f"Anna's Archive {i+1}",
-                'text': "Meta-Search Engine"
-            })
-        
-        # Add Z-Library links (Rank #3 - Large database, good performance)
-        z_lib_links = [
-            f"https://z-library.sk/md5/{md5_hash}",
-            f"https://z-lib.org/md5/{md5_hash}",
-            f"https://b-ok.org/md5/{md5_hash}",
-            f"https://booksc.eu/md5/{md5_hash}",
-        ]
-        
-        for i, url in enumerate(z_lib_links):
-            additional_links.append({
-                'url': url,
-                'type': 'z_library',
-                'name': f'Z-Library {i+1}',
-                'text': 'Comprehensive Shadow Library'
-            })
-        
-        # Add Ocean of PDF links (Rank #4 - Clean interface, quick downloads)
-        ocean_pdf_links = [
-            f"https://oceanofpdf.com/?s={md5_hash}",
-            f"https://oceanofpdf.com/search/{md5_hash}",
-        ]
-        
-        for i, url in enumerate(ocean_pdf_links):
-            additional_links.append({
-                'url': url,
-                'type': 'ocean_pdf',
-                'name': f'Ocean of PDF {i+1}',
-                'text': 'Clean Interface'
-            })
-        
-        # Add Liber3 links (Rank #5 - Fast and typically ad-free)
-        liber3_links = [
-            f"https://liber3.eth.limo/search?q={md5_hash}",
-        ]
-        
-        for url in liber3_links:
-            additional_links.append({
-                'url': url,
-                'type': 'liber3',
-                'name': 'Liber3',
-                'text': 'Fast & Ad-Free'
-            })
-        
-        # Add Memory of the World links (Rank #6 - Solid fallback option)
-        memory_world_links = [
-            f"https://library.memoryoftheworld.org/search?q={md5_hash}",
-            f"https://library.memoryoftheworld.org/md5/{md5_hash}",
-        ]
-        
-        for i, url in enumerate(memory_world_links):
-            additional_links.append({
-                'url': url,
-                'type': 'memory_world',
-                'name': f'Memory of the World {i+1}',
-                'text': 'Minimal Overhead'
-            })
-        
-        # Add Sci-Hub links (Rank #7 - Academic papers and books)
-        scihub_links = [
-            f"https://sci-hub.se/{md5_hash}",
-            f"https://sci-hub.st/{md5_hash}",
-            f"https://sci-hub.ru/{md5_hash}",
-        ]
-        
-        for i, url in enumerate(scihub_links):
-            additional_links.append({
-                'url': url,
-                'type': 'scihub',
-                'name': f'Sci-Hub {i+1}',
-                'text': 'Academic Papers'
-            })
-        
-        # Add direct download links (Rank #8 - Direct file access)
-        direct_links = [
-            f"https://libgen.lc/get.php?md5={md5_hash}",
-            f"http://libgen.lc/get.php?md5={md5_hash}",
-            f"https://library.lol/get.php?md5={md5_hash}",
-            f"http://library.lol/get.php?md5={md5_hash}",
-        ]
-        
-        for i, url in enumerate(direct_links):
-            additional_links.append({
-                'url': url,
-                'type': 'direct_download',
-                'name': f'Direct Download {i+1}',
-                'text': 'Direct File Access'
-            })
-        
-        # Add direct LibGen mirror links (Updated September 2025 - comprehensive list)
-        libgen_direct_links = [
-            # Active Mirrors (Sep 2025) - Primary
-            f"https://libgen.li/book/index.php?md5={md5_hash}",
-            f"https://libgen.la/book/index.php?md5={md5_hash}",
-            f"https://libgen.gl/book/index.php?md5={md5_hash}",
-            f"https://libgen.vg/book/index.php?md5={md5_hash}",
-            f"https://libgen.bz/book/index.php?md5={md5_hash}",
-            f"https://libgen.is/book/index.php?md5={md5_hash}",
-            # Russian LibGen-related Mirrors
-            f"http://libgen.rs/book/index.php?md5={md5_hash}",
-            f"http://gen.lib.rus.ec/book/index.php?md5={md5_hash}",
-            f"https://libgen.fun/book/index.php?md5={md5_hash}",
-        ]
-        
-        for url in libgen_direct_links:
-            additional_links.append({
-                'url': url,
-                'type': 'libgen_direct',
-                'name': 'LibGen Direct',
-                'text': 'LibGen Mirror'
-            })
-        
-        # Add CyberLeninka (Legal Russian Repository for scientific papers)
-        cyberleninka_links = [
-            f"https://cyberleninka.ru/search?q={md5_hash}",
+        return [
+            {
+                'url': url_template.format(md5=md5_hash),
+                'type': link_type,
+                'name': name,
+                'text': text
+            }
+            for url_template, link_type, name, text in _ADDITIONAL_SOURCE_TEMPLATES
         ]
-        
-        for url in cyberleninka_links:
-            additional_links.append({
-                'url': url,
-                'type': 'cyberleninka',
-                'name': 'CyberLeninka',
-                'text': 'Legal Russian Repository'
-            })
-        
-        return additional_links
     
     async def _test_download_link(self, session: aiohttp.ClientSession, url: str, referer: str = None) -> bool:
         """
@@ -711,26 +838,37 @@ class LibGenSearcher:
             if referer:
                 headers['Referer'] = referer
             
+            timeout = aiohttp.ClientTimeout(total=5.0)
+            
             # Make a HEAD request to check if the link resolves
-            async with session.head(url, headers=headers, allow_redirects=True, timeout=aiohttp.ClientTimeout(total=5.0)) as response:
-                # Check if we get a successful response and it's not an error page
-                if response.status == 200:
-                    content_type = response.headers.get('Content-Type', '').lower()
-                    content_length = response.headers.get('Content-Length', '0')
-                    
-                    # Check if it looks like a real file (not HTML error page)
-                    if 'text/html' not in content_type and int(content_length) > 0:
-                        return True
-                    # Also accept if it's a redirect to a file
-                    elif 'application/' in content_type or 'text/plain' in content_type:
-                        return True
-                
-                return False
+            async with session.head(url, headers=headers, allow_redirects=True, timeout=timeout, ssl=_VERIFIED_SSL) as response:
+                if response.status != 405:
+                    return self._looks_like_file(response)
+            
+            # HEAD not allowed - fetch only the first byte instead of the whole file
+            ranged_headers = {**headers, 'Range': 'bytes=0-0'}
+            async with session.get(url, headers=ranged_headers, allow_redirects=True, timeout=timeout, ssl=_VERIFIED_SSL) as response:
+                return self._looks_like_file(response)
                 
         except Exception as e:
-            logger.debug(f"Link test failed for {url}: {e}")
+            logger.debug("Link test failed for %s: %s", url, e)
+            return False
+        
+    def _looks_like_file(self, response: aiohttp.ClientResponse) -> bool:
+        """Check whether a HEAD or ranged GET response points at a real file."""
+        # Check if we get a successful response and it's not an error page
+        if response.status not in (200, 206):
             return False
         
+        content_type = response.headers.get('Content-Type', '').lower()
+        content_length = response.headers.get('Content-Length', '0')
+        
+        # Check if it looks like a real file (not HTML error page)
+        if 'text/html' not in content_type and int(content_length) > 0:
+            return True
+        # Also accept if it's a redirect to a file
+        return 'application/' in content_type or 'text/plain' in content_type
+        
     async def _get_final_download_links(self, mirror: str, md5_hash: str) -> List[Dict[str, str]]:
         """
         Get final download links by following LibGen's pattern:
@@ -745,196 +883,188 @@ class LibGenSearcher:
             ads_url = f"{mirror}/ads.php?md5={md5_hash}"
             logger.info(f"🔗 Step 1: Accessing ads.php for {md5_hash} on {mirror}")
             
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10.0)) as session:
-                # Get the ads.php page (might redirect)
-                logger.info(f"🔗 Step 2: Making GET request to {ads_url}")
-                async with session.get(ads_url) as response:
-                    logger.info(f"🔗 Step 3: Got response status {response.status}")
-                    if response.status != 200:
-                        logger.warning(f"🔗 Step 4: Bad response status {response.status}, returning empty")
-                        return download_links
-                        
-                    logger.info(f"🔗 Step 5: Reading response text...")
-                    html = await response.text()
-                    logger.info(f"🔗 Step 6: Got {len(html)} characters of HTML")
-                    final_url = str(response.url)  # Get final URL after redirects
+            session = await self.http_client.get_aio_session()
+            # Get the ads.php page (might redirect)
+            logger.info(f"🔗 Step 2: Making GET request to {ads_url}")
+            async with session.get(ads_url, timeout=aiohttp.ClientTimeout(total=10.0), ssl=_VERIFIED_SSL) as response:
+                logger.info(f"🔗 Step 3: Got response status {response.status}")
+                if response.status != 200:
+                    logger.warning(f"🔗 Step 4: Bad response status {response.status}, returning empty")
+                    # 404 means the mirror has no such book; other errors mean it didn't answer
+                    if response.status != 404:
+                        response.raise_for_status()
+                    return download_links
                     
-                    # Parse the final page for download links
-                    logger.info(f"🔗 Step 7: Parsing HTML with BeautifulSoup...")
-                    soup = BeautifulSoup(html, 'html.parser')
-                    logger.info(f"🔗 Step 8: BeautifulSoup parsing complete")
-                    
-                    # Prefer any direct mirrors first (Cloudflare/IPFS/CDN endpoints) if present
-                    direct_patterns = [
-                        r'https?://(?:[\w.-]*cloudflare|cfcdn)[\w.-]*/[^\s\"]+',
-                        r'https?://ipfs\.[\w.-]+/[^\s\"]+',
-                        r'https?://(?:[\w.-]*cdn)[\w.-]*/[^\s\"]+'
-                    ]
-                    direct_links: List[Dict[str, str]] = []
-                    for pattern in direct_patterns:
-                        for a in soup.find_all('a', href=re.compile(pattern, re.I)):
-                            href = a.get('href')
-                            if not href:
-                                continue
-                            direct_links.append({
-                                'url': href,
-                                'type': 'direct_mirror',
-                                'name': 'Direct Mirror',
-                                'text': a.get_text(strip=True) or 'Direct Mirror'
-                            })
-
-                    # If we found direct links, optionally resolve and return them with priority
-                    if direct_links:
-                        resolved_direct: List[Dict[str, str]] = []
-                        for dl in direct_links:
-                            resolved_url = dl['url']
-                            filename = None
-                            content_type = None
-                            if self.resolve_final_urls:
-                                try:
-                                    resolution = await self._resolve_download_link(session, dl['url'], referer=final_url)
-                                    resolved_url = resolution.get('final_url') or dl['url']
-                                    filename = resolution.get('filename')
-                                    content_type = resolution.get('content_type')
-                                except Exception:
-                                    pass
-                            link_dict = {**dl, 'url': resolved_url}
-                            if filename:
-                                link_dict['filename'] = filename
-                            if content_type:
-                                link_dict['content_type'] = content_type
-                            resolved_direct.append(link_dict)
-                        download_links.extend(resolved_direct)
+                logger.info(f"🔗 Step 5: Reading response text...")
+                html = await response.text()
+                logger.info(f"🔗 Step 6: Got {len(html)} characters of HTML")
+                final_url = str(response.url)  # Get final URL after redirects
+                
+                # Parse the final page for download links
+                logger.info(f"🔗 Step 7: Parsing HTML with BeautifulSoup...")
+                soup = BeautifulSoup(html, 'html.parser')
+                logger.info(f"🔗 Step 8: BeautifulSoup parsing complete")
+                
+                # Prefer any direct mirrors first (Cloudflare/IPFS/CDN endpoints) if present
+                direct_links: List[Dict[str, str]] = []
+                for pattern in _DIRECT_MIRROR_RES:
+                    for a in soup.find_all('a', href=pattern):
+                        href = a.get('href')
+                        if not href:
+                            continue
+                        direct_links.append({
+                            'url': href,
+                            'type': 'direct_mirror',
+                            'name': 'Direct Mirror',
+                            'text': a.get_text(strip=True) or 'Direct Mirror'
+                        })
 
-                    # Look for the main GET button/link (pattern: get.php?md5=hash&key=key)
-                    logger.info(f"🔗 Step 9: Looking for get.php links...")
-                    get_links = soup.find_all('a', href=re.compile(r'get\.php\?md5=[a-f0-9]{32}&key=\w+'))
-                    logger.info(f"🔗 Step 10: Found {len(get_links)} get.php links")
-                    
-                    logger.info(f"🔗 Step 11: Processing {len(get_links)} get.php links...")
-                    for i, link in enumerate(get_links):
-                        logger.info(f"🔗 Step 11.{i+1}: Processing link {i+1}/{len(get_links)}")
-                        href = link.get('href')
-                        logger.info(f"🔗 Step 11.{i+1}.1: Got href: {href}")
-                        if href:
-                            if href.startswith('http'):
-                                final_download_url = href
-                            else:
-                                final_download_url = urljoin(final_url, href)
-                            
-                            # Skip URL resolution to prevent timeouts - use original URL directly
-                            logger.info(f"🔗 Step 11.{i+1}.2: Skipping URL resolution to prevent timeouts")
-                            filename = None
-                            resolved_url = final_download_url
-                            content_type = None
-                            
-                            # Create multiple link variants for better user experience
-                            base_url = final_download_url
-                            
-                            # 1. Test and add original link only if it works
-                            if await self._test_download_link(session, resolved_url, final_url):
-                                link_dict: Dict[str, str] = {
-                                    'url': resolved_url,
-                                    'type': 'direct_download',
-                                    'name': 'Direct Download',
-                                    'text': link.get_text(strip=True)
-                                }
-                                if filename:
-                                    link_dict['filename'] = filename
-                                if content_type:
-                                    link_dict['content_type'] = content_type
-                                download_links.append(link_dict)
-                                logger.info(f"✅ Verified primary link: {mirror}")
-                            else:
-                                logger.info(f"❌ Primary link failed verification: {mirror}")
-                            
-                            # 2. Create links to other mirrors for true diversity
+                # If we found direct links, optionally resolve and return them with priority
+                if direct_links:
+                    resolved_direct: List[Dict[str, str]] = []
+                    for dl in direct_links:
+                        resolved_url = dl['url']
+                        filename = None
+                        content_type = None
+                        if self.resolve_final_urls:
                             try:
-                                from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
-                                parsed = urlparse(base_url)
-                                if 'get.php' in parsed.path:
-                                    # Parse existing parameters
-                                    query_params = parse_qs(parsed.query)
-                                    md5_hash = query_params.get('md5', [''])[0]
-                                    
-                                    if md5_hash:
-                                        # Create links to other mirrors for true diversity
-                                        other_mirrors = [
-                                            'https://libgen.li', 'https://libgen.gl', 'https://libgen.vg', 
-                                            'https://libgen.bz', 'https://libgen.is', 'https://libgen.pw',
-                                            'https://libgen.ee', 'http://libgen.rs', 'http://gen.lib.rus.ec',
-                                            'https://libgen.fun', 'https://libgen.st', 'http://library.lol'
-                                        ]
-                                        
-                                        # Get current mirror domain to avoid duplicates
-                                        current_domain = parsed.netloc
-                                        
-                                        # Test each mirror link before adding it
-                                        mirror_links = []
-                                        for other_mirror in other_mirrors:
-                                            if other_mirror not in mirror and other_mirror.split('://')[1] != current_domain:
-                                                # Create direct download link for other mirror
-                                                other_url = f"{other_mirror}/get.php?md5={md5_hash}&key={query_params.get('key', [''])[0]}"
-                                                
-                                                # Test if the link resolves to a real file
-                                                if await self._test_download_link(session, other_url, final_url):
-                                                    mirror_links.append({
-                                                        'url': other_url,
-                                                        'type': 'mirror_download',
-                                                        'name': f'Mirror ({other_mirror.split("://")[1]})',
-                                                        'text': f'Mirror: {other_mirror.split("://")[1]}'
-                                                    })
-                                                    logger.info(f"✅ Verified working link: {other_mirror}")
-                                                else:
-                                                    logger.info(f"❌ Link failed verification: {other_mirror}")
-                                        
-                                        # Add verified mirror links (up to 7)
-                                        download_links.extend(mirror_links[:7])
-                                        
-                                        # Limit to 8 alternatives per source for more options
-                                        if len([l for l in download_links if l['type'] == 'alternative_download']) >= 8:
-                                            break
-                            except Exception as e:
-                                logger.warning(f"Error creating alternative URLs: {e}")
+                                resolution = await self._resolve_download_link(session, dl['url'], referer=final_url)
+                                resolved_url = resolution.get('final_url') or dl['url']
+                                filename = resolution.get('filename')
+                                content_type = resolution.get('content_type')
+                            except Exception:
                                 pass
-                            
-                    # Also look for alternative download links
-                    alt_links = soup.find_all('a', href=re.compile(r'/file\.php\?id=\d+'))
-                    for link in alt_links:
-                        href = link.get('href')
-                        if href:
-                            if href.startswith('http'):
-                                alt_url = href
-                            else:
-                                alt_url = urljoin(final_url, href)
-                            
-                            # Optionally resolve alt link
-                            filename = None
-                            resolved_url = alt_url
-                            content_type = None
-                            if self.resolve_final_urls:
-                                try:
-                                    resolution = await self._resolve_download_link(session, alt_url, referer=final_url)
-                                    resolved_url = resolution.get('final_url') or alt_url
-                                    filename = resolution.get('filename')
-                                    content_type = resolution.get('content_type')
-                                except Exception as _:
-                                    pass
-                            
-                            alt_dict: Dict[str, str] = {
+                        link_dict = {**dl, 'url': resolved_url}
+                        if filename:
+                            link_dict['filename'] = filename
+                        if content_type:
+                            link_dict['content_type'] = content_type
+                        resolved_direct.append(link_dict)
+                    download_links.extend(resolved_direct)
+
+                # Look for the main GET button/link (pattern: get.php?md5=hash&key=key)
+                logger.info(f"🔗 Step 9: Looking for get.php links...")
+                get_links = soup.find_all('a', href=_GET_PHP_RE)
+                logger.info(f"🔗 Step 10: Found {len(get_links)} get.php links")
+                
+                logger.info(f"🔗 Step 11: Processing {len(get_links)} get.php links...")
+                for i, link in enumerate(get_links):
+                    logger.info(f"🔗 Step 11.{i+1}: Processing link {i+1}/{len(get_links)}")
+                    href = link.get('href')
+                    logger.info(f"🔗 Step 11.{i+1}.1: Got href: {href}")
+                    if href:
+                        if href.startswith('http'):
+                            final_download_url = href
+                        else:
+                            final_download_url = urljoin(final_url, href)
+                        
+                        # Skip URL resolution to prevent timeouts - use original URL directly
+                        logger.info(f"🔗 Step 11.{i+1}.2: Skipping URL resolution to prevent timeouts")
+                        filename = None
+                        resolved_url = final_download_url
+                        content_type = None
+                        
+                        # Create multiple link variants for better user experience
+                        base_url = final_download_url
+                        
+                        # 1. Test and add original link only if it works
+                        if await self._test_download_link(session, resolved_url, final_url):
+                            link_dict: Dict[str, str] = {
                                 'url': resolved_url,
-                                'type': 'file_download',
-                                'name': 'Alternative Download',
+                                'type': 'direct_download',
+                                'name': 'Direct Download',
                                 'text': link.get_text(strip=True)
                             }
                             if filename:
-                                alt_dict['filename'] = filename
+                                link_dict['filename'] = filename
                             if content_type:
-                                alt_dict['content_type'] = content_type
-                            download_links.append(alt_dict)
-                            
+                                link_dict['content_type'] = content_type
+                            download_links.append(link_dict)
+                            logger.info(f"✅ Verified primary link: {mirror}")
+                        else:
+                            logger.info(f"❌ Primary link failed verification: {mirror}")
+                        
+                        # 2. Create links to other mirrors for true diversity
+                        try:
+                            parsed = urlparse(base_url)
+                            if 'get.php' in parsed.path:
+                                # Parse existing parameters
+                                query_params = parse_qs(parsed.query)
+                                md5_hash = query_params.get('md5', [''])[0]
+                                
+                                if md5_hash:
+                                    # Get current mirror domain to avoid duplicates
+                                    current_domain = parsed.netloc
+                                    
+                                    # Test each mirror link before adding it
+                                    mirror_links = []
+                                    for other_mirror in _GET_PHP_MIRRORS:
+                                        if other_mirror not in mirror and other_mirror.split('://')[1] != current_domain:
+                                            # Create direct download link for other mirror
+                                            other_url = f"{other_mirror}/get.php?md5={md5_hash}&key={query_params.get('key', [''])[0]}"
+                                            
+                                            # Test if the link resolves to a real file
+                                            if await self._test_download_link(session, other_url, final_url):
+                                                mirror_links.append({
+                                                    'url': other_url,
+                                                    'type': 'mirror_download',
+                                                    'name': f'Mirror ({other_mirror.split("://")[1]})',
+                                                    'text': f'Mirror: {other_mirror.split("://")[1]}'
+                                                })
+                                                logger.info(f"✅ Verified working link: {other_mirror}")
+                                            else:
+                                                logger.info(f"❌ Link failed verification: {other_mirror}")
+                                    
+                                    # Add verified mirror links (up to 7)
+                                    download_links.extend(mirror_links[:7])
+                                    
+                                    # Limit to 8 alternatives per source for more options
+                                    if len([l for l in download_links if l['type'] == 'alternative_download']) >= 8:
+                                        break
+                        except Exception as e:
+                            logger.warning(f"Error creating alternative URLs: {e}")
+                            pass
+                        
+                # Also look for alternative download links
+                alt_links = soup.find_all('a', href=_FILE_PHP_RE)
+                for link in alt_links:
+                    href = link.get('href')
+                    if href:
+                        if href.startswith('http'):
+                            alt_url = href
+                        else:
+                            alt_url = urljoin(final_url, href)
+                        
+                        # Optionally resolve alt link
+                        filename = None
+                        resolved_url = alt_url
+                        content_type = None
+                        if self.resolve_final_urls:
+                            try:
+                                resolution = await self._resolve_download_link(session, alt_url, referer=final_url)
+                                resolved_url = resolution.get('final_url') or alt_url
+                                filename = resolution.get('filename')
+                                content_type = resolution.get('content_type')
+                            except Exception as _:
+                                pass
+                        
+                        alt_dict: Dict[str, str] = {
+                            'url': resolved_url,
+                            'type': 'file_download',
+                            'name': 'Alternative Download',
+                            'text': link.get_text(strip=True)
+                        }
+                        if filename:
+                            alt_dict['filename'] = filename
+                        if content_type:
+                            alt_dict['content_type'] = content_type
+                        download_links.append(alt_dict)
+                        
         except Exception as e:
-            logger.debug(f"Error getting final download links from {mirror}: {str(e)}")
+            logger.debug("Error getting final download links from %s: %s", mirror, e)
+            # Keep links parsed before the failure; with none, report the mirror as failed
+            if not download_links:
+                raise
             
         return download_links
         
@@ -948,19 +1078,19 @@ class LibGenSearcher:
             f"{mirror}/book/index.php?md5={md5_hash}",
         ]
         
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10.0)) as session:
-            for url in url_patterns:
-                try:
-                    async with session.get(url) as response:
-                        if response.status == 200:
-                            html = await response.text()
-                            links = self._extract_download_links(html, mirror)
-                            if links:
-                                download_urls.extend(links)
-                                break
-                except Exception as e:
-                    logger.debug(f"Error fetching {url}: {str(e)}")
-                    continue
+        session = await self.http_client.get_aio_session()
+        for url in url_patterns:
+            try:
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10.0), ssl=_VERIFIED_SSL) as response:
+                    if response.status == 200:
+                        html = await response.text()
+                        links = self._extract_download_links(html, mirror)
+                        if links:
+                            download_urls.extend(links)
+                            break
+            except Exception as e:
+                logger.debug("Error fetching %s: %s", url, e)
+                continue
                     
         return download_urls
         
@@ -975,7 +1105,7 @@ class LibGenSearcher:
         if referer:
             headers['Referer'] = referer
         try:
-            async with session.head(url, headers=headers, allow_redirects=True) as resp:
+            async with session.head(url, headers=headers, allow_redirects=True, ssl=_VERIFIED_SSL) as resp:
                 final_url = str(resp.url)
                 disposition = resp.headers.get('Content-Disposition', '')
                 filename = self._extract_filename_from_disposition(disposition) or self._infer_filename_from_url(final_url)
@@ -987,7 +1117,7 @@ class LibGenSearcher:
         except Exception:
             # Fallback to a ranged GET request
             ranged_headers = {**headers, 'Range': 'bytes=0-0'}
-            async with session.get(url, headers=ranged_headers, allow_redirects=True) as resp:
+            async with session.get(url, headers=ranged_headers, allow_redirects=True, ssl=_VERIFIED_SSL) as resp:
                 final_url = str(resp.url)
                 disposition = resp.headers.get('Content-Disposition', '')
                 filename = self._extract_filename_from_disposition(disposition) or self._infer_filename_from_url(final_url)
@@ -1006,17 +1136,16 @@ class LibGenSearcher:
         if not content_disposition:
             return None
         # Try RFC 5987 filename*
-        match_ext = re.search(r"filename\*=(?:UTF-8''|)\s*([^;]+)", content_disposition, flags=re.IGNORECASE)
+        match_ext = FILENAME_EXT_RE.search(content_disposition)
         if match_ext:
             filename = match_ext.group(1)
             try:
                 # Handle percent-encoding
-                from urllib.parse import unquote
                 return unquote(filename.strip('"'))
             except Exception:
                 return filename.strip('"')
         # Fallback to filename=
-        match = re.search(r'filename="?([^";]+)"?', content_disposition, flags=re.IGNORECASE)
+        match = FILENAME_RE.search(content_disposition)
         if match:
             return match.group(1)
         return None
@@ -1024,7 +1153,6 @@ class LibGenSearcher:
     def _infer_filename_from_url(self, url: str) -> Optional[str]:
         """Infer a reasonable filename from the URL path if possible."""
         try:
-            from urllib.parse import urlparse, unquote
             path = urlparse(url).path
             if not path:
                 return None
@@ -1043,7 +1171,7 @@ class LibGenSearcher:
             soup = BeautifulSoup(html, 'html.parser')
             
             # Look for download buttons/links
-            download_elements = soup.find_all(['a', 'button'], string=re.compile(r'download|get|mirror', re.I))
+            download_elements = soup.find_all(['a', 'button'], string=_DOWNLOAD_TEXT_RE)
             
             for element in download_elements:
                 href = element.get('href')
@@ -1128,6 +1256,24 @@ class LibGenSearcher:
         logger.info(f"Using {len(available_mirrors)} mirrors in priority order")
         return available_mirrors
 
+    def _get_mirror_timeout(self, mirror: str) -> float:
+        """
+        Get the search timeout for a mirror based on its local health.
+        
+        A healthy mirror gets the base timeout; each recent failure stretches it,
+        up to twice the base for a mirror that keeps failing.
+        """
+        health = self.mirror_health.get(mirror, 0)
+        return self.mirror_timeout_base * (health / _MAX_MIRROR_HEALTH + 1)
+    
+    def _update_mirror_health(self, mirror: str, success: bool):
+        """Move a mirror's saturating health counter towards healthy on success, away on failure."""
+        health = self.mirror_health.get(mirror, 0)
+        if success:
+            self.mirror_health[mirror] = max(health - 1, 0)
+        else:
+            self.mirror_health[mirror] = min(health + 1, _MAX_MIRROR_HEALTH)
+    
     def _update_mirror_reliability(self, mirror: str, success: bool, response_time: float):
         """
         Update mirror reliability statistics for intelligent fallback.
@@ -1174,6 +1320,23 @@ class LibGenSearcher:
         else:
             self.mirror_response_times[mirror] = response_time
 
+    def _get_cache_status(self) -> Dict[str, Any]:
+        """
+        Get search cache statistics for monitoring.
+        
+        Returns:
+            Dictionary with cache size, hits, misses and hit rate
+        """
+        hits = self.search_stats['cache_hits']
+        misses = self.search_stats['cache_misses']
+        lookups = hits + misses
+        return {
+            'entries': len(self.search_cache),
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': (hits / lookups * 100) if lookups > 0 else 0.0
+        }
+
     def _get_mirror_status(self) -> Dict[str, Any]:
         """
         Get current mirror status for monitoring and debugging.
@@ -1195,6 +1358,7 @@ class LibGenSearcher:
                 'total_requests': reliability_data.get('total_requests', 0),
                 'avg_response_time': self.mirror_response_times.get(mirror, 0),
                 'is_failed': mirror in self.failed_mirrors,
+                'health': self.mirror_health.get(mirror, 0),
                 'last_success': reliability_data.get('last_success', 0),
                 'last_failure': reliability_data.get('last_failure', 0)
             }
@@ -1202,6 +1366,17 @@ class LibGenSearcher:
         return status
 
 
+# Global searcher instance, shared so every user hits the same caches and mirror health
+_searcher: Optional[LibGenSearcher] = None
+
+def get_searcher() -> LibGenSearcher:
+    """Get the global LibGen searcher instance"""
+    global _searcher
+    if _searcher is None:
+        _searcher = LibGenSearcher()
+    return _searcher
+
+
 # Example usage and testing
 async def test_search():
     """Test function for the LibGen searcher."""
@@ -1213,16 +1388,22 @@ async def test_search():
         "1984 George Orwell"
     ]
     
-    for query in test_queries:
-        print(f"\n--- Testing search: {query} ---")
-        results = await searcher.search(query, max_results=3)
-        
+    all_results = await asyncio.gather(
+        *(searcher.search(query, max_results=3) for query in test_queries)
+    )
+    
+    lines = []
+    for query, results in zip(test_queries, all_results):
+        lines.append(f"\n--- Testing search: {query} ---")
         for i, book in enumerate(results, 1):
-            print(f"{i}. {book['title']} by {book['author']} ({book['year']})")
-            print(f"   Size: {book['size']} | Format: {book['extension']} | Pages: {book['pages']}")
-            print(f"   MD5: {book.get('md5', 'N/A')}")
+            lines.append(f"{i}. {book['title']} by {book['author']} ({book['year']})")
+            lines.append(f"   Size: {book['size']} | Format: {book['extension']} | Pages: {book['pages']}")
+            lines.append(f"   MD5: {book.get('md5', 'N/A')}")
+    
+    sys.stdout.write('\n'.join(lines) + '\n')
             
 
 if __name__ == "__main__":
+    install_uvloop()
     # Run test
     asyncio.run(test_search())
@@ -5,6 +5,7 @@ Formats book information for display in Telegram messages.
 """
 
 import re
+import html
 from typing import List, Dict, Any
 from .logger import setup_logger
 
@@ -14,6 +15,27 @@ logger = setup_logger(__name__)
 class BookFormatter:
     """Utility class for formatting book information for Telegram display."""
     
+    # Size strings that carry no information
+    EMPTY_SIZES = frozenset({'0', '', 'Unknown'})
+    
+    # Spellings of long size units, normalized to their short form
+    SIZE_UNIT_ALIASES = {
+        'BYTES': 'B',
+        'KILOBYTES': 'KB',
+        'KBYTES': 'KB',
+        'MEGABYTES': 'MB',
+        'MBYTES': 'MB',
+        'GIGABYTES': 'GB',
+        'GBYTES': 'GB',
+    }
+    
+    # Languages that are not worth calling out in search results
+    DEFAULT_LANGUAGES = frozenset({'english', 'en', ''})
+    
+    # Display limits for titles and authors in HTML result messages
+    MAX_TITLE_LENGTH = 120
+    MAX_AUTHOR_LENGTH = 80
+    
     # File size units for conversion
     SIZE_UNITS = ['B', 'KB', 'MB', 'GB']
     
@@ -99,7 +121,7 @@ class BookFormatter:
             
         # Add language if available and not English
         language = book.get('language', '').strip().lower()
-        if language and language not in ['english', 'en', '']:
+        if language and language not in self.DEFAULT_LANGUAGES:
             result += f"\n🌐 <b>Language:</b> {language.title()}"
             
         return result
@@ -217,7 +239,7 @@ class BookFormatter:
         
     def _format_file_size(self, size_str: str) -> str:
         """Convert file size to human-readable format."""
-        if not size_str or size_str.strip() in ['0', '', 'Unknown']:
+        if not size_str or size_str.strip() in self.EMPTY_SIZES:
             return 'Unknown'
             
         # Try to extract numeric value and unit
@@ -231,14 +253,7 @@ class BookFormatter:
             unit = size_match.group(2).upper() or 'B'
             
             # Normalize unit
-            if unit in ['BYTES']:
-                unit = 'B'
-            elif unit in ['KILOBYTES', 'KBYTES']:
-                unit = 'KB'
-            elif unit in ['MEGABYTES', 'MBYTES']:
-                unit = 'MB'
-            elif unit in ['GIGABYTES', 'GBYTES']:
-                unit = 'GB'
+            unit = self.SIZE_UNIT_ALIASES.get(unit, unit)
                 
             # Format based on size
             if unit == 'B' and value >= 1024:
@@ -274,6 +289,11 @@ class BookFormatter:
             
         return text[:max_length-3] + "..."
         
+    def clean_text(self, text: str, max_length: int) -> str:
+        """Truncate text for display and escape it for Telegram HTML messages."""
+        # Truncate before escaping so an entity like &amp; is never cut in half
+        return html.escape(self._truncate_text(text, max_length))
+        
     def _clean_link_text(self, text: str) -> str:
         """Clean up download link text for display."""
         if not text:
@@ -0,0 +1,18 @@
+"""
+Event Loop Setup
+Installs uvloop for the bot and for the searcher's command-line entry point
+"""
+
+import sys
+
+
+def install_uvloop() -> bool:
+    """Use uvloop as the asyncio event loop when it is available."""
+    if sys.platform == 'win32':
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    uvloop.install()
+    return True
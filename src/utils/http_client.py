@@ -8,9 +8,7 @@ import aiohttp
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from urllib3.poolmanager import PoolManager
 import ssl
-import time
 from typing import Optional, Dict, Any
 import logging
 
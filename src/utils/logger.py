@@ -129,38 +129,48 @@ def log_function_call(func):
     """
     Decorator to log function calls with parameters and execution time.
     
+    Coroutine functions are detected at decoration time and handed to
+    log_async_function_call, so one decorator works for both.
+    
     Usage:
         @log_function_call
         def my_function(param1, param2):
             pass
     """
     import functools
+    import inspect
     import time
     
+    if inspect.iscoroutinefunction(func):
+        return log_async_function_call(func)
+    
+    # Resolve the logger once per decorated function instead of on every call
+    logger = logging.getLogger(func.__module__)
+    
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        logger = logging.getLogger(func.__module__)
-        
         # Log function entry
-        args_str = ', '.join(str(arg) for arg in args[:3])  # Limit to first 3 args
-        if len(args) > 3:
-            args_str += ', ...'
+        if logger.isEnabledFor(logging.DEBUG):
+            args_str = ', '.join(str(arg) for arg in args[:3])  # Limit to first 3 args
+            if len(args) > 3:
+                args_str += ', ...'
             
-        kwargs_str = ', '.join(f'{k}={v}' for k, v in list(kwargs.items())[:3])
-        if len(kwargs) > 3:
-            kwargs_str += ', ...'
+            kwargs_str = ', '.join(f'{k}={v}' for k, v in list(kwargs.items())[:3])
+            if len(kwargs) > 3:
+                kwargs_str += ', ...'
             
-        logger.debug(f"Calling {func.__name__}({args_str}{', ' + kwargs_str if kwargs_str else ''})")
+            logger.debug(f"Calling {func.__name__}({args_str}{', ' + kwargs_str if kwargs_str else ''})")
         
         # Execute function and measure time
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             result = func(*args, **kwargs)
-            execution_time = time.time() - start_time
-            logger.debug(f"{func.__name__} completed in {execution_time:.3f}s")
+            if logger.isEnabledFor(logging.DEBUG):
+                execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+                logger.debug(f"{func.__name__} completed in {execution_time:.3f}s")
             return result
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             logger.error(f"{func.__name__} failed after {execution_time:.3f}s: {str(e)}")
             raise
             
@@ -179,30 +189,33 @@ def log_async_function_call(func):
     import functools
     import time
     
+    # Resolve the logger once per decorated function instead of on every call
+    logger = logging.getLogger(func.__module__)
+    
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
-        logger = logging.getLogger(func.__module__)
-        
         # Log function entry
-        args_str = ', '.join(str(arg)[:50] for arg in args[:3])  # Limit arg length
-        if len(args) > 3:
-            args_str += ', ...'
+        if logger.isEnabledFor(logging.DEBUG):
+            args_str = ', '.join(str(arg)[:50] for arg in args[:3])  # Limit arg length
+            if len(args) > 3:
+                args_str += ', ...'
             
-        kwargs_str = ', '.join(f'{k}={str(v)[:50]}' for k, v in list(kwargs.items())[:3])
-        if len(kwargs) > 3:
-            kwargs_str += ', ...'
+            kwargs_str = ', '.join(f'{k}={str(v)[:50]}' for k, v in list(kwargs.items())[:3])
+            if len(kwargs) > 3:
+                kwargs_str += ', ...'
             
-        logger.debug(f"Calling {func.__name__}({args_str}{', ' + kwargs_str if kwargs_str else ''})")
+            logger.debug(f"Calling {func.__name__}({args_str}{', ' + kwargs_str if kwargs_str else ''})")
         
         # Execute function and measure time
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             result = await func(*args, **kwargs)
-            execution_time = time.time() - start_time
-            logger.debug(f"{func.__name__} completed in {execution_time:.3f}s")
+            if logger.isEnabledFor(logging.DEBUG):
+                execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+                logger.debug(f"{func.__name__} completed in {execution_time:.3f}s")
             return result
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             logger.error(f"{func.__name__} failed after {execution_time:.3f}s: {str(e)}")
             raise
             